@@ -0,0 +1,57 @@
+"""Synthetic Keycloak payloads shared by the benchmarks."""
+
+from typing import Any
+
+
+def user(index: int) -> dict[str, Any]:
+    """A user as returned by ``GET /admin/realms/{realm}/users``."""
+    return {
+        "id": f"4b6f1f5e-7d2a-4c1b-9a3e-{index:012d}",
+        "createdTimestamp": 1700000000000 + index,
+        "username": f"user{index}",
+        "enabled": index % 10 != 0,
+        "totp": False,
+        "emailVerified": index % 3 != 0,
+        "firstName": "Jane",
+        "lastName": "Doe",
+        "email": f"user{index}@example.com",
+        "attributes": {"locale": ["en"], "department": [f"dep{index % 20}"]},
+        "federationLink": "6f9b3a2e-1c4d-4e8f-a5b7-c9d1e3f5a7b9",
+        "origin": "ldap",
+        "disableableCredentialTypes": [],
+        "requiredActions": [] if index % 3 else ["VERIFY_EMAIL"],
+        "notBefore": 0,
+        "access": {
+            "manageGroupMembership": True,
+            "view": True,
+            "mapRoles": True,
+            "impersonate": False,
+            "manage": True,
+        },
+    }
+
+
+def users(count: int) -> list[dict[str, Any]]:
+    return [user(index) for index in range(count)]
+
+
+def admin_event(index: int) -> dict[str, Any]:
+    """An event as returned by ``GET /admin/realms/{realm}/admin-events``."""
+    return {
+        "time": 1700000000000 + index,
+        "realmId": "8e4a2b1c-3f5d-4e6a-9b7c-0d1e2f3a4b5c",
+        "authDetails": {
+            "realmId": "8e4a2b1c-3f5d-4e6a-9b7c-0d1e2f3a4b5c",
+            "clientId": "0f1e2d3c-4b5a-6978-8a9b-acbdcedfe0f1",
+            "userId": "1a2b3c4d-5e6f-4a8b-9cad-becfd0e1f2a3",
+            "ipAddress": "10.0.0.1",
+        },
+        "operationType": ("CREATE", "UPDATE", "DELETE")[index % 3],
+        "resourceType": "USER",
+        "resourcePath": f"users/4b6f1f5e-7d2a-4c1b-9a3e-{index:012d}",
+        "representation": '{"enabled":true,"emailVerified":false}',
+    }
+
+
+def admin_events(count: int) -> list[dict[str, Any]]:
+    return [admin_event(index) for index in range(count)]
@@ -0,0 +1,46 @@
+"""Compares filtering users in ``Columns`` with filtering dataclasses.
+
+Selects the users which are enabled but whose email is not verified.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run python benchmarks/columns.py
+"""
+
+import timeit
+
+from _payloads import users
+
+from keycloak_admin_aio.types import Columns, UserRepresentation
+
+COUNT = 500_000
+
+
+def main():
+    payload = users(COUNT)
+    representations = UserRepresentation.from_list(payload)
+    columns = Columns(UserRepresentation)
+    columns.extend(payload)
+
+    def filter_representations() -> int:
+        return sum(
+            1
+            for user in representations
+            if user.enabled and user.emailVerified is False
+        )
+
+    def filter_columns() -> int:
+        mask = columns["enabled"].is_true() & columns["emailVerified"].is_false()
+        return mask.count()
+
+    assert filter_representations() == filter_columns()
+    loop = min(timeit.repeat(filter_representations, number=1, repeat=5))
+    vectorized = min(timeit.repeat(filter_columns, number=1, repeat=5))
+    print(
+        f"{COUNT} users: dataclasses {loop * 1000:8.2f} ms, "
+        f"columns {vectorized * 1000:8.2f} ms, {loop / vectorized:6.0f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Reports the memory held by users parsed with and without string interning.
+
+The users are decoded page by page from JSON, so that equal strings are
+distinct objects like in real responses.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run python benchmarks/interning.py
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Union
+
+from _payloads import user
+
+from keycloak_admin_aio.types import StringTable, UserRepresentation
+
+COUNT = 500_000
+PAGE_SIZE = 1_000
+
+
+def pages() -> list[bytes]:
+    return [
+        json.dumps([user(index) for index in range(first, first + PAGE_SIZE)]).encode()
+        for first in range(0, COUNT, PAGE_SIZE)
+    ]
+
+
+def bytes_per_user(contents: list[bytes], intern: Union[bool, StringTable]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    users = []
+    for content in contents:
+        users.extend(UserRepresentation.from_list(json.loads(content), intern=intern))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del users
+    return size / COUNT
+
+
+def main():
+    contents = pages()
+    variants: dict[str, Union[bool, StringTable]] = {
+        "no interning": False,
+        "per response": True,
+        "across the scan": StringTable(),
+    }
+    for name, intern in variants.items():
+        print(f"{name:>16}: {bytes_per_user(contents, intern):6.0f} bytes per user")
+
+
+if __name__ == "__main__":
+    main()
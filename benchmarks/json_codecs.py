@@ -0,0 +1,57 @@
+"""Compares the json codecs on pages of users and admin events.
+
+Codecs which are not installed are skipped.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run --with orjson --with msgspec python benchmarks/json_codecs.py
+"""
+
+import timeit
+
+from _payloads import admin_events, users
+
+from keycloak_admin_aio import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+)
+
+
+def installed_codecs() -> list[JsonCodec]:
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    for codec in (OrjsonJsonCodec, MsgspecJsonCodec):
+        try:
+            codecs.append(codec())
+        except ImportError:
+            print(f"{codec.name} is not installed")
+    return codecs
+
+
+def measure(function, repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    codecs = installed_codecs()
+    payloads = {
+        "100 users": users(100),
+        "10000 users": users(10_000),
+        "100000 admin events": admin_events(100_000),
+    }
+    for payload_name, payload in payloads.items():
+        content = StdlibJsonCodec().dumps(payload)
+        repeat = max(3, 10_000_000 // len(content))
+        print(f"{payload_name} ({len(content) / 1024:.0f} KiB)")
+        for codec in codecs:
+            loads = measure(lambda: codec.loads(content), repeat)
+            dumps = measure(lambda: codec.dumps(payload), repeat)
+            print(
+                f"  {codec.name:>8}: loads {loads * 1000:8.2f} ms, "
+                f"dumps {dumps * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Reports the memory held per user by each representation variant.
+
+The users are parsed from a synthetic payload and measured with
+``tracemalloc``. The payload is dropped after parsing, so the memory of the
+resulting objects including the strings, lists and dicts they took over
+from the payload is reported.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run python benchmarks/memory.py
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from _payloads import users
+
+from keycloak_admin_aio.types import Columns, UserRepresentation, slotted
+
+COUNT = 100_000
+
+
+def bytes_per_user(parse: Callable[[list[dict[str, Any]]], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    payload = users(COUNT)
+    parsed = parse(payload)
+    del payload
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return size / COUNT
+
+
+def columns(payload: list[dict[str, Any]]) -> Columns:
+    columns = Columns(UserRepresentation)
+    columns.extend(payload)
+    return columns
+
+
+def main():
+    variants = {
+        "dict": lambda payload: payload,
+        "UserRepresentation": UserRepresentation.from_list,
+        "slotted.UserRepresentation": slotted.UserRepresentation.from_list,
+        "Columns": columns,
+    }
+    for name, parse in variants.items():
+        print(f"{name:>28}: {bytes_per_user(parse):6.0f} bytes per user")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measures the client-side overhead of a request.
+
+The requests are answered by an ``httpx.MockTransport`` so the time spent in
+the library and httpx remains: building the url, authenticating, sending and
+parsing the response.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run python benchmarks/request_overhead.py
+"""
+
+import asyncio
+import time
+
+import httpx
+from _payloads import user
+
+from keycloak_admin_aio import KeycloakAdmin
+
+NUMBER = 20_000
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/protocol/openid-connect/token"):
+        return httpx.Response(
+            200,
+            json={
+                "access_token": "access-token",
+                "expires_in": 3600,
+                "refresh_token": "refresh-token",
+                "refresh_expires_in": 3600,
+            },
+        )
+    if request.url.path.endswith("/role-mappings/realm"):
+        return httpx.Response(200, json=[{"id": "role-id", "name": "role"}])
+    return httpx.Response(200, json=user(0))
+
+
+async def main():
+    kc = KeycloakAdmin.with_password(
+        "http://localhost:8080",
+        username="admin",
+        password="admin",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    realm_role_mappings = kc.users.by_id("user-id").role_mappings.realm
+    requests = {
+        "users.by_id.get": lambda: kc.users.by_id("user-id").get(),
+        "users.by_id.role_mappings.realm.get": (
+            lambda: kc.users.by_id("user-id").role_mappings.realm.get()
+        ),
+        "reused handle: realm.get": realm_role_mappings.get,
+    }
+    async with kc:
+        for name, request in requests.items():
+            await request()
+            start = time.perf_counter()
+            for _ in range(NUMBER):
+                await request()
+            seconds = time.perf_counter() - start
+            print(f"{name:38} {seconds / NUMBER * 1e6:8.1f} µs/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
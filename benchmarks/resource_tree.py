@@ -0,0 +1,49 @@
+"""Measures how many chains of resources through ``by_id`` are built per second.
+
+No requests are sent, only the resource objects are created, or taken
+from the handle cache with ``handle_cache_size``.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run python benchmarks/resource_tree.py
+"""
+
+import timeit
+
+from keycloak_admin_aio import KeycloakAdmin
+
+NUMBER = 200_000
+
+
+def measure(handle_cache_size: int):
+    kc = KeycloakAdmin.with_password(
+        "http://localhost:8080",
+        username="admin",
+        password="admin",
+        handle_cache_size=handle_cache_size,
+    )
+    chains = {
+        "users.by_id": lambda: kc.users.by_id("user-id"),
+        "users.by_id.role_mappings.realm": (
+            lambda: kc.users.by_id("user-id").role_mappings.realm
+        ),
+        "groups.by_id.members": lambda: kc.groups.by_id("group-id").members,
+        "clients.by_id.user_sessions": (
+            lambda: kc.clients.by_id("client-id").user_sessions
+        ),
+    }
+    for name, chain in chains.items():
+        seconds = min(timeit.repeat(chain, number=NUMBER, repeat=5))
+        print(f"{name:34} {NUMBER / seconds:12,.0f} chains/s")
+    if handle_cache_size:
+        print(f"hit rate: {kc.handle_cache_metrics.hit_rate:.4f}")
+
+
+def main():
+    for handle_cache_size in (0, 1024):
+        print(f"handle_cache_size={handle_cache_size}")
+        measure(handle_cache_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compares ``DataClass.to_dict_list`` with ``dataclasses.asdict``.
+
+``dataclasses.asdict`` deep copies every representation, which then has
+to be walked a second time to strip ``None`` values. The compiled
+serializers do both in one pass.
+
+.. code:: shell
+
+    PYTHONPATH=. uv run python benchmarks/serialization.py
+"""
+
+import dataclasses
+import timeit
+
+from _payloads import users
+
+from keycloak_admin_aio._lib.utils import remove_none
+from keycloak_admin_aio.types import UserRepresentation
+
+
+def asdict_list(representations: list[UserRepresentation]) -> list[dict]:
+    return [
+        remove_none(dataclasses.asdict(representation))
+        for representation in representations
+    ]
+
+
+def main():
+    for count in (1_000, 10_000, 100_000):
+        representations = UserRepresentation.from_list(users(count))
+        repeat = max(1, 100_000 // count)
+        baseline = min(
+            timeit.repeat(lambda: asdict_list(representations), number=1, repeat=repeat)
+        )
+        compiled = min(
+            timeit.repeat(
+                lambda: UserRepresentation.to_dict_list(representations),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(
+            f"{count:>7} users: asdict {baseline * 1000:8.1f} ms, "
+            f"compiled {compiled * 1000:8.1f} ms, {baseline / compiled:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
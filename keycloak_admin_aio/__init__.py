@@ -1,6 +1,41 @@
 """This package provides a asynchronous Keycloak Admin API wrapper."""
 
-from ._keycloak_admin_aio import KeycloakAdmin
+from ._json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    StdlibJsonCodec,
+    default_json_codec,
+)
+from ._keycloak_admin_aio import KeycloakAdmin, KeycloakAdminRealm, RealmResult
+from ._metrics import (
+    HandleCacheMetrics,
+    RateLimitMetrics,
+    RetryMetrics,
+    TokenLockMetrics,
+)
+from ._rate_limit import RateLimit
+from ._retry import RetryPolicy
+from ._token_store import FileTokenStore, InMemoryTokenStore, Token, TokenStore
 from .types import *
 
-__all__ = ["KeycloakAdmin"]
+__all__ = [
+    "KeycloakAdmin",
+    "KeycloakAdminRealm",
+    "RealmResult",
+    "TokenLockMetrics",
+    "HandleCacheMetrics",
+    "RetryPolicy",
+    "RetryMetrics",
+    "RateLimit",
+    "RateLimitMetrics",
+    "Token",
+    "TokenStore",
+    "InMemoryTokenStore",
+    "FileTokenStore",
+    "JsonCodec",
+    "StdlibJsonCodec",
+    "OrjsonJsonCodec",
+    "MsgspecJsonCodec",
+    "default_json_codec",
+]
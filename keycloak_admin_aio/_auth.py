@@ -0,0 +1,37 @@
+from typing import AsyncGenerator, Awaitable, Callable
+
+import httpx
+
+RETRY_UNAUTHORIZED_EXTENSION = "keycloak_admin_aio.retry_unauthorized"
+"""Marks a request whose ``401`` response is handled by ``AccessTokenAuth``."""
+
+
+class AccessTokenAuth(httpx.Auth):
+    """Authenticates requests with the ``access_token`` of a ``KeycloakAdmin``.
+
+    It is attached to the connection once. Each request reads the current
+    token, if Keycloak rejects it with ``401`` the token is renewed and the
+    request is retried once.
+    """
+
+    def __init__(
+        self,
+        get_access_token: Callable[[], Awaitable[str]],
+        renew_access_token: Callable[[str], Awaitable[str]],
+    ):
+        self._get_access_token = get_access_token
+        self._renew_access_token = renew_access_token
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        access_token = await self._get_access_token()
+        request.headers["Authorization"] = f"Bearer {access_token}"
+        request.extensions[RETRY_UNAUTHORIZED_EXTENSION] = True
+        response = yield request
+        if response.status_code != httpx.codes.UNAUTHORIZED:
+            return
+        access_token = await self._renew_access_token(access_token)
+        request.headers["Authorization"] = f"Bearer {access_token}"
+        del request.extensions[RETRY_UNAUTHORIZED_EXTENSION]
+        yield request
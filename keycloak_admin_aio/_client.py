@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from ._json_codec import JSON_CODEC_EXTENSION, JsonCodec
+from ._metrics import RetryMetrics
+from ._rate_limit import (
+    RESOURCE_EXTENSION,
+    UNLIMITED_EXTENSION,
+    RateLimit,
+    RateLimiter,
+)
+from ._retry import RetryPolicy
+
+
+class KeycloakClient(httpx.AsyncClient):
+    """The ``httpx.AsyncClient`` shared by all resources of a ``KeycloakAdmin``.
+
+    Request bodies passed as ``json`` are encoded with ``json_codec``, which
+    is also attached to each request for decoding its response with
+    ``load_json``. With a ``retry_policy`` failed requests are retried,
+    which is counted in ``retry_metrics``.
+
+    Each attempt is admitted by the ``RateLimiter`` of the resource class
+    which sent the request (see ``for_resource``), if there is one for it in
+    ``resource_rate_limits``, and then by the one of ``rate_limit``. The
+    admission lasts until the response is closed, which for streamed
+    responses is after their body was received.
+    """
+
+    def __init__(
+        self,
+        json_codec: JsonCodec,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        resource_rate_limits: Optional[dict[type, RateLimit]] = None,
+        **httpx_args: Any,
+    ):
+        super().__init__(**httpx_args)
+        self.json_codec = json_codec
+        self.retry_policy = retry_policy
+        self.retry_metrics = RetryMetrics()
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.resource_rate_limiters = {
+            resource: RateLimiter(resource_rate_limit)
+            for resource, resource_rate_limit in (resource_rate_limits or {}).items()
+        }
+        self._resource_connections: dict[type, ResourceConnection] = {}
+
+    def for_resource(self, resource: type) -> ResourceConnection:
+        """Get the connection tagging requests as sent by the ``resource`` class."""
+        try:
+            return self._resource_connections[resource]
+        except KeyError:
+            connection = self._resource_connections[resource] = ResourceConnection(
+                self, resource
+            )
+            return connection
+
+    def build_request(
+        self,
+        method: str,
+        url: Any,
+        *,
+        json: Any = None,
+        headers: Any = None,
+        extensions: Any = None,
+        **kwargs: Any,
+    ) -> httpx.Request:
+        if json is not None:
+            kwargs["content"] = self.json_codec.dumps(json)
+            headers = httpx.Headers(headers)
+            headers.setdefault("Content-Type", "application/json")
+        extensions = {**(extensions or {}), JSON_CODEC_EXTENSION: self.json_codec}
+        return super().build_request(
+            method, url, headers=headers, extensions=extensions, **kwargs
+        )
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        retry_policy = self.retry_policy
+        if retry_policy is None:
+            return await self._send_admitted(request, **kwargs)
+        attempt = 1
+        while True:
+            try:
+                return await self._send_admitted(request, **kwargs)
+            except (httpx.HTTPStatusError, httpx.TransportError) as error:
+                if not retry_policy.should_retry(request, error):
+                    raise
+                if attempt >= retry_policy.max_attempts:
+                    self.retry_metrics.exhausted += 1
+                    raise
+                delay = retry_policy.delay(attempt, error)
+                self.retry_metrics.record_retry(error, delay)
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_admitted(
+        self, request: httpx.Request, **kwargs: Any
+    ) -> httpx.Response:
+        if request.extensions.get(UNLIMITED_EXTENSION) or not (
+            self.rate_limiter or self.resource_rate_limiters
+        ):
+            return await super().send(request, **kwargs)
+        rate_limiters = [
+            rate_limiter
+            for rate_limiter in (
+                self.resource_rate_limiters.get(
+                    request.extensions.get(RESOURCE_EXTENSION)
+                ),
+                self.rate_limiter,
+            )
+            if rate_limiter is not None
+        ]
+        async with AsyncExitStack() as stack:
+            for rate_limiter in rate_limiters:
+                await stack.enter_async_context(rate_limiter.admit())
+            response = await super().send(request, **kwargs)
+            if kwargs.get("stream") and not response.is_closed:
+                response.stream = _AdmittedStream(response.stream, stack.pop_all())
+            return response
+
+
+class _AdmittedStream(httpx.AsyncByteStream):
+    """Body of a streamed response which ends the admission of its request when closed."""
+
+    def __init__(self, stream: Any, admission: AsyncExitStack):
+        self._stream = stream
+        self._admission = admission
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            await self._admission.aclose()
+
+
+class ResourceConnection:
+    """Sends requests through a ``KeycloakClient`` tagged with a resource class.
+
+    Resources get this from ``_get_connection``. It provides the subset of
+    the ``httpx.AsyncClient`` methods used by the resources.
+    """
+
+    __slots__ = ("client", "extensions")
+
+    def __init__(self, client: KeycloakClient, resource: type):
+        self.client = client
+        self.extensions = {RESOURCE_EXTENSION: resource}
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.client.request(
+            method, url, extensions=self.extensions, **kwargs
+        )
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    def stream(self, method: str, url: str, **kwargs: Any):
+        return self.client.stream(method, url, extensions=self.extensions, **kwargs)
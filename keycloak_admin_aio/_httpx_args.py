@@ -1,9 +1,17 @@
 import httpx
 
+from ._auth import RETRY_UNAUTHORIZED_EXTENSION
+
 
 async def raise_for_status_hook(response: httpx.Response):
     if response.status_code >= 400:
         await response.aread()
+    if (
+        response.status_code == httpx.codes.UNAUTHORIZED
+        and response.request.extensions.get(RETRY_UNAUTHORIZED_EXTENSION)
+    ):
+        # AccessTokenAuth renews the token and retries the request
+        return
     response.raise_for_status()
 
 
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import abc
+import json
+from typing import Any
+
+import httpx
+
+JSON_CODEC_EXTENSION = "keycloak_admin_aio.json_codec"
+
+
+class JsonCodec(abc.ABC):
+    """Encodes request bodies and decodes response bodies.
+
+    ``KeycloakAdmin`` uses the fastest installed codec by default (see
+    ``default_json_codec``). Another codec can be passed as ``json_codec``.
+
+    .. code:: python
+
+        from keycloak_admin_aio import KeycloakAdmin, StdlibJsonCodec
+
+        kc = KeycloakAdmin.with_password(
+            ...,  # provide credentials
+            json_codec=StdlibJsonCodec(),
+        )
+    """
+
+    name: str
+
+    @abc.abstractmethod
+    def loads(self, content: bytes) -> Any:
+        """Decode a JSON document."""
+
+    @abc.abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """Encode ``data`` as UTF-8 JSON."""
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Uses the ``json`` module of the standard library like httpx does."""
+
+    name = "json"
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+
+class OrjsonJsonCodec(JsonCodec):
+    """Uses `orjson <https://github.com/ijl/orjson>`_ which needs to be installed."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def loads(self, content: bytes) -> Any:
+        return self._loads(content)
+
+    def dumps(self, data: Any) -> bytes:
+        return self._dumps(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """Uses `msgspec <https://github.com/jcrist/msgspec>`_ which needs to be installed."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+    def dumps(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+
+def default_json_codec() -> JsonCodec:
+    """Get the first installed codec out of orjson, msgspec and stdlib json."""
+    for codec in (OrjsonJsonCodec, MsgspecJsonCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return StdlibJsonCodec()
+
+
+def load_json(response: httpx.Response) -> Any:
+    """Decode the body of ``response`` with the codec of its client."""
+    codec = response.request.extensions.get(JSON_CODEC_EXTENSION)
+    if codec is None:
+        return response.json()
+    return codec.loads(response.content)
@@ -1,44 +1,94 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import httpx
 
+from ._auth import AccessTokenAuth
+from ._client import KeycloakClient
 from ._httpx_args import merge_with_default_httpx_args
-from ._lib.utils import remove_none
-from ._resources import (
-    AdminEvents,
-    AttachedResources,
-    AttackDetection,
-    Authentication,
-    Clients,
-    ClientScopes,
-    Groups,
-    Roles,
-    Sessions,
-    Users,
+from ._json_codec import JsonCodec, default_json_codec, load_json
+from ._lib.concurrency import run_concurrently
+from ._lib.utils import cast_non_optional, remove_none
+from ._metrics import (
+    HandleCacheMetrics,
+    RateLimitMetrics,
+    RetryMetrics,
+    TokenLockMetrics,
 )
+from ._rate_limit import UNLIMITED_EXTENSION, RateLimit
+from ._resources import AttachedResources, attach_lazily, get_resource_class
+from ._resources.keycloak_resource import GetConnectionFn, HandleCache
+from ._retry import IDEMPOTENT_EXTENSION, RetryPolicy
+from ._token_store import InMemoryTokenStore, Token, TokenStore
 
+if TYPE_CHECKING:
+    from ._resources import (
+        AdminEvents,
+        AttackDetection,
+        Authentication,
+        Clients,
+        ClientScopes,
+        Groups,
+        Roles,
+        Sessions,
+        Users,
+    )
 
-class KeycloakAdmin:
-    """Base class for Keycloak Admin API endpoints.
+T = TypeVar("T")
 
-    It handles the ``access_token`` and guarantees it being valid when using the
-    ``get_access_token`` method or accessing a protected Keycloak resource.
+_token_errors = (httpx.HTTPError, KeyError, ValueError)
+"""Errors of failed token requests, including unexpected token responses."""
+
+_background_refresh_retry_base = 1.0
+"""Seconds to wait before retrying a failed background refresh the first time."""
+
+_background_refresh_retry_max = 60.0
+"""Upper bound of the wait in seconds before retrying a failed background refresh."""
+
+
+@dataclass
+class RealmResult(Generic[T]):
+    """Outcome of a call made by ``KeycloakAdmin.fan_out`` for one realm."""
+
+    realm: str
+    result: Optional[T] = None
+    error: Optional[Exception] = None
+
+
+class _RealmResources:
+    """Attaches the Keycloak resources of a realm.
+
+    The resources are created on first access.
     """
 
-    __keycloak_resources: AttachedResources = [
-        ("roles", Roles),
-        ("client_scopes", ClientScopes),
-        ("users", Users),
-        ("clients", Clients),
-        ("admin_events", AdminEvents),
-        ("authentication", Authentication),
-        ("groups", Groups),
-        ("sessions", Sessions),
-        ("attack_detection", AttackDetection),
+    _keycloak_resources: AttachedResources = [
+        ("roles", "Roles"),
+        ("client_scopes", "ClientScopes"),
+        ("users", "Users"),
+        ("clients", "Clients"),
+        ("admin_events", "AdminEvents"),
+        ("authentication", "Authentication"),
+        ("groups", "Groups"),
+        ("sessions", "Sessions"),
+        ("attack_detection", "AttackDetection"),
     ]
     roles: Roles
     """https://www.keycloak.org/docs-api/26.0.0/rest-api/index.html#_roles"""
@@ -66,9 +116,60 @@ class KeycloakAdmin:
     attack_detection: AttackDetection
     """https://www.keycloak.org/docs-api/26.0.0/rest-api/index.html#_attack_detection"""
 
+    _server_url: str
+    _realm: str
+    _get_connection: GetConnectionFn
+    _handle_cache: Optional[HandleCache] = None
+
+    @property
+    def _get_client(self) -> GetConnectionFn:
+        return self._get_connection
+
+    def get_url(self):
+        """Get the admin api base url."""
+        return f"{self._server_url}/admin/realms/{self._realm}"
+
+
+attach_lazily(_RealmResources, _RealmResources._keycloak_resources)
+
+
+class KeycloakAdmin(_RealmResources):
+    """Base class for Keycloak Admin API endpoints.
+
+    It handles the ``access_token`` and guarantees it being valid when using the
+    ``get_access_token`` method or accessing a protected Keycloak resource.
+    """
+
     leeway: int
     """A token will be considered as expired seconds before its actual expiry controlled by this value."""
 
+    refresh_in_background: bool
+    """Renew the token ahead of its expiry in a background task started on entering the context manager."""
+
+    background_refresh_error: Optional[Exception]
+    """Error of the last background refresh if it failed, ``None`` once a refresh succeeds."""
+
+    access_token_expire: datetime
+    """Expiry of the current ``access_token`` shortened by ``leeway``."""
+
+    refresh_token_expire: Optional[datetime]
+    """Expiry of the current ``refresh_token`` shortened by ``leeway``."""
+
+    token_lock_metrics: TokenLockMetrics
+    """Instrumentation of the lock serializing token acquisition."""
+
+    handle_cache_metrics: HandleCacheMetrics
+    """Hit rate of the cache of resource handles enabled by ``handle_cache_size``."""
+
+    retry_metrics: RetryMetrics
+    """Retries of failed requests made according to the ``retry_policy``."""
+
+    rate_limit_metrics: Optional[RateLimitMetrics]
+    """Queue of the requests waiting for admission by the ``rate_limit``."""
+
+    resource_rate_limit_metrics: dict[Union[type, str], RateLimitMetrics]
+    """Queues of the requests waiting for admission by the ``resource_rate_limits``, by the same keys."""
+
     def __init__(
         self,
         server_url: str,
@@ -80,6 +181,13 @@ class KeycloakAdmin:
         realm: str = "master",
         leeway: int = 10,
         httpx_args={},
+        refresh_in_background: bool = False,
+        token_store: Optional[TokenStore] = None,
+        json_codec: Optional[JsonCodec] = None,
+        handle_cache_size: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        resource_rate_limits: Optional[dict[Union[type, str], RateLimit]] = None,
     ):
         """Initialize ``KeycloakAdmin`` with either client or user credentials.
 
@@ -98,13 +206,48 @@ class KeycloakAdmin:
         self._server_url = server_url
         self._grant_type = grant_type
         self.leeway = leeway
-        self.__connection = httpx.AsyncClient(
-            **merge_with_default_httpx_args(httpx_args)
+        self.refresh_in_background = refresh_in_background
+        resource_classes = {
+            resource: (
+                get_resource_class(_RealmResources, resource)
+                if isinstance(resource, str)
+                else resource
+            )
+            for resource in resource_rate_limits or {}
+        }
+        self.__connection = KeycloakClient(
+            json_codec or default_json_codec(),
+            retry_policy,
+            rate_limit,
+            {
+                resource_classes[resource]: resource_rate_limit
+                for resource, resource_rate_limit in (
+                    resource_rate_limits or {}
+                ).items()
+            },
+            **merge_with_default_httpx_args(httpx_args),
+        )
+        self.retry_metrics = self.__connection.retry_metrics
+        rate_limiter = self.__connection.rate_limiter
+        self.rate_limit_metrics = rate_limiter.metrics if rate_limiter else None
+        self.resource_rate_limit_metrics = {
+            resource: self.__connection.resource_rate_limiters[resource_class].metrics
+            for resource, resource_class in resource_classes.items()
+        }
+        self.__connection.auth = AccessTokenAuth(
+            self.get_access_token, self.__renew_rejected_access_token
         )
-        self.__access_token = None
-        self.__refresh_token = None
-        self.__set_keycloak_resources()
+        self.__access_token: Optional[str] = None
+        self.__token_store = token_store or InMemoryTokenStore()
         self.__lock = asyncio.Lock()
+        self.token_lock_metrics = TokenLockMetrics()
+        self.handle_cache_metrics = HandleCacheMetrics()
+        if handle_cache_size:
+            self._handle_cache = HandleCache(
+                handle_cache_size, self.handle_cache_metrics
+            )
+        self.__background_refresh: Optional[asyncio.Task] = None
+        self.background_refresh_error = None
 
     @classmethod
     def with_client_credentials(
@@ -115,6 +258,13 @@ class KeycloakAdmin:
         realm: str = "master",
         leeway: int = 10,
         httpx_args={},
+        refresh_in_background: bool = False,
+        token_store: Optional[TokenStore] = None,
+        json_codec: Optional[JsonCodec] = None,
+        handle_cache_size: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        resource_rate_limits: Optional[dict[Union[type, str], RateLimit]] = None,
     ) -> KeycloakAdmin:
         """Instantiate ``KeycloakAdmin`` with ``client_id`` and ``client_secret``."""
         return cls(
@@ -125,6 +275,13 @@ class KeycloakAdmin:
             realm=realm,
             leeway=leeway,
             httpx_args=httpx_args,
+            refresh_in_background=refresh_in_background,
+            token_store=token_store,
+            json_codec=json_codec,
+            handle_cache_size=handle_cache_size,
+            retry_policy=retry_policy,
+            rate_limit=rate_limit,
+            resource_rate_limits=resource_rate_limits,
         )
 
     @classmethod
@@ -137,6 +294,13 @@ class KeycloakAdmin:
         realm: str = "master",
         leeway: int = 10,
         httpx_args={},
+        refresh_in_background: bool = False,
+        token_store: Optional[TokenStore] = None,
+        json_codec: Optional[JsonCodec] = None,
+        handle_cache_size: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimit] = None,
+        resource_rate_limits: Optional[dict[Union[type, str], RateLimit]] = None,
     ) -> KeycloakAdmin:
         """Instantiate ``KeycloakAdmin`` with user credentials (username and password)."""
         return cls(
@@ -148,6 +312,13 @@ class KeycloakAdmin:
             realm=realm,
             leeway=leeway,
             httpx_args=httpx_args,
+            refresh_in_background=refresh_in_background,
+            token_store=token_store,
+            json_codec=json_codec,
+            handle_cache_size=handle_cache_size,
+            retry_policy=retry_policy,
+            rate_limit=rate_limit,
+            resource_rate_limits=resource_rate_limits,
         )
 
     @property
@@ -185,12 +356,66 @@ class KeycloakAdmin:
         """Token endpoint grant type."""
         return self._grant_type
 
-    def get_url(self):
-        """Get the admin api base url."""
-        return f"{self._server_url}/admin/realms/{self._realm}"
+    def for_realm(self, realm: str) -> KeycloakAdminRealm:
+        """Get a view managing ``realm`` with this instance's connection and token.
+
+        Creating a view is cheap, its resources are created on first access.
+
+        .. code:: python
+
+            users: list[UserRepresentation] = await kc.for_realm("tenant-a").users.get()
+        """
+        return KeycloakAdminRealm(
+            self._server_url,
+            realm,
+            self._get_connection,
+            self._handle_cache,
+        )
+
+    async def fan_out(
+        self,
+        realms: Iterable[str],
+        call: Callable[[KeycloakAdminRealm], Awaitable[T]],
+        concurrency: int = 10,
+    ) -> AsyncIterator[RealmResult[T]]:
+        """Make the same call for several realms concurrently.
+
+        ``call`` receives a view of each realm (see ``for_realm``). At most
+        ``concurrency`` calls are in flight over the shared connection. The
+        results are yielded as they complete, an exception raised by a call
+        is reported as the ``error`` of its realm.
+
+        .. code:: python
+
+            async for realm_result in kc.fan_out(
+                ["tenant-a", "tenant-b"], lambda realm: realm.users.count()
+            ):
+                print(realm_result.realm, realm_result.result, realm_result.error)
+        """
+
+        async def call_for_realm(realm: str) -> RealmResult[T]:
+            try:
+                return RealmResult(realm, result=await call(self.for_realm(realm)))
+            except Exception as ex:
+                return RealmResult(realm, error=ex)
+
+        factories = (lambda realm=realm: call_for_realm(realm) for realm in realms)
+        results = run_concurrently(factories, concurrency)
+        try:
+            async for future in results:
+                yield future.result()
+        finally:
+            await results.aclose()
 
     async def close(self):
-        """Closes open httpx connection."""
+        """Stops the background token refresh and closes open httpx connection."""
+        if self.__background_refresh:
+            self.__background_refresh.cancel()
+            try:
+                await self.__background_refresh
+            except asyncio.CancelledError:
+                pass
+            self.__background_refresh = None
         await self.__connection.aclose()
 
     def close_sync(self):
@@ -198,16 +423,12 @@ class KeycloakAdmin:
         loop = asyncio.get_event_loop()
         loop.run_until_complete(self.close())
 
-    def __set_keycloak_resources(self):
-        for resources_name, resource in self.__keycloak_resources:
-            setattr(
-                self,
-                resources_name,
-                resource(self.__get_connection, self.get_url),
-            )
-
     async def __aenter__(self) -> KeycloakAdmin:
         """For entering asynchronous context manger."""
+        if self.refresh_in_background and not self.__background_refresh:
+            self.__background_refresh = asyncio.create_task(
+                self.__refresh_periodically()
+            )
         return self
 
     async def __aexit__(self, *_, **__):
@@ -215,61 +436,157 @@ class KeycloakAdmin:
         await self.close()
 
     async def get_access_token(self):
-        """Get ``access_token``. Guaranteed not to be expired."""
+        """Get ``access_token``. Guaranteed not to be expired.
+
+        A valid cached token is returned without acquiring the lock. Only
+        callers finding the token expired are serialized, the first of which
+        fetches a new one.
+        """
+        if self.__is_access_token_valid():
+            self.token_lock_metrics.fast_path_hits += 1
+            return self.__access_token
+        wait_start = time.perf_counter()
         async with self.__lock:
-            if not self.__access_token:
-                await self.__token()
-            else:
-                now = datetime.now()
-                if now > self.access_token_expire:
-                    if now < self.refresh_token_expire:
-                        await self.__token_refresh()
+            self.token_lock_metrics.record_lock_wait(time.perf_counter() - wait_start)
+            if not self.__is_access_token_valid():
+                await self.__renew_access_token()
+            return self.__access_token
+
+    def __is_access_token_valid(self) -> bool:
+        return (
+            self.__access_token is not None
+            and datetime.now() <= self.access_token_expire
+        )
+
+    async def __renew_access_token(self, stale_access_token: Optional[str] = None):
+        """Adopts a valid token from the token store or fetches a new one.
+
+        A stored token equal to ``stale_access_token`` is not adopted. New
+        tokens are fetched while holding the store's lock, so that instances
+        sharing the store fetch only once.
+        """
+
+        def is_usable(token: Optional[Token]) -> bool:
+            return (
+                token is not None
+                and token.access_token != stale_access_token
+                and token.is_access_token_valid()
+            )
+
+        token = await self.__token_store.get()
+        if not is_usable(token):
+            async with self.__token_store.lock():
+                token = await self.__token_store.get()
+                if not is_usable(token):
+                    if token is not None and token.is_refresh_token_valid():
+                        token = await self.__token_refresh(token)
                     else:
-                        await self.__token()
+                        token = await self.__token()
+                    await self.__token_store.set(token)
+        self.__adopt_token(cast_non_optional(token))
+
+    def __adopt_token(self, token: Token):
+        self.__access_token = token.access_token
+        self.access_token_expire = token.access_token_expire
+        self.refresh_token_expire = token.refresh_token_expire
+
+    async def __renew_rejected_access_token(self, rejected_access_token: str) -> str:
+        """Renews a token Keycloak rejected unless a concurrent caller already did."""
+        wait_start = time.perf_counter()
+        async with self.__lock:
+            self.token_lock_metrics.record_lock_wait(time.perf_counter() - wait_start)
+            if self.__access_token == rejected_access_token:
+                await self.__renew_access_token(rejected_access_token)
             return self.__access_token
 
+    async def __refresh_periodically(self):
+        """Renews the token ahead of its expiry until cancelled by ``close``.
+
+        The renewal happens at a random point in the last quarter of the
+        token's remaining lifetime so that several clients don't hit the token
+        endpoint at the same time. A failure is kept in
+        ``background_refresh_error`` and retried with an exponential backoff,
+        so bad credentials or an unreachable server don't make it hammer the
+        token endpoint. Meanwhile ``get_access_token`` renews the token on
+        demand.
+        """
+        renew = False
+        failures = 0
+        while True:
+            try:
+                if renew:
+                    async with self.__lock:
+                        await self.__renew_access_token(self.__access_token)
+                else:
+                    await self.get_access_token()
+            except _token_errors as error:
+                self.background_refresh_error = error
+                failures += 1
+                delay = min(
+                    _background_refresh_retry_max,
+                    _background_refresh_retry_base * 2 ** (failures - 1),
+                )
+            else:
+                self.background_refresh_error = None
+                renew = True
+                failures = 0
+                delay = self.__background_refresh_delay()
+            await asyncio.sleep(delay)
+
+    def __background_refresh_delay(self) -> float:
+        remaining = (self.access_token_expire - datetime.now()).total_seconds()
+        return max(remaining * random.uniform(0.75, 0.9), 1.0)
+
     def get_token_url(self) -> str:
         """Openid connect token endpoint url."""
         return f"{self._server_url}/realms/{self._realm}/protocol/openid-connect/token"
 
-    def __parse_token_response(self, token_response: dict[str, Any]):
-        self.__access_token = token_response["access_token"]
-        self.__refresh_token = token_response.get("refresh_token")
-        self.access_token_expire = datetime.now() + timedelta(
-            seconds=token_response["expires_in"] - self.leeway
-        )
-        self.refresh_token_expire = datetime.now() + timedelta(
-            seconds=token_response.get("refresh_expires_in", 0) - self.leeway
+    def __parse_token_response(self, token_response: dict[str, Any]) -> Token:
+        now = datetime.now()
+        return Token(
+            access_token=token_response["access_token"],
+            access_token_expire=now
+            + timedelta(seconds=token_response["expires_in"] - self.leeway),
+            refresh_token=token_response.get("refresh_token"),
+            refresh_token_expire=now
+            + timedelta(
+                seconds=token_response.get("refresh_expires_in", 0) - self.leeway
+            ),
         )
 
-    async def __token_refresh(self):
+    async def __token_refresh(self, token: Token) -> Token:
         headers = httpx.Headers({"Content-Type": "application/x-www-form-urlencoded"})
         payload = remove_none(
             {
                 "client_id": self._client_id,
                 "client_secret": self._client_secret,
                 "grant_type": "refresh_token",
-                "refresh_token": self.__refresh_token,
+                "refresh_token": token.refresh_token,
             }
         )
         try:
             response = await self.__connection.post(
-                self.get_token_url(), data=payload, headers=headers
+                self.get_token_url(),
+                data=payload,
+                headers=headers,
+                auth=None,
+                extensions={IDEMPOTENT_EXTENSION: True, UNLIMITED_EXTENSION: True},
             )
-            self.__parse_token_response(response.json())
+            return self.__parse_token_response(load_json(response))
         except httpx.HTTPStatusError as ex:
             except_errors = [
                 "Refresh token expired",
                 "Token is not active",
                 "Session not active",
             ]
-            error_description = ex.response.json().get("error_description", "")
+            error_description = load_json(ex.response).get("error_description", "")
             if ex.response.status_code == 400 and any(
                 error in error_description for error in except_errors
             ):
-                await self.__token()
+                return await self.__token()
+            raise ex
 
-    async def __token(self):
+    async def __token(self) -> Token:
         headers = httpx.Headers({"Content-Type": "application/x-www-form-urlencoded"})
         payload = remove_none(
             {
@@ -281,16 +598,47 @@ class KeycloakAdmin:
             }
         )
         response = await self.__connection.post(
-            self.get_token_url(), data=payload, headers=headers
+            self.get_token_url(),
+            data=payload,
+            headers=headers,
+            auth=None,
+            extensions={IDEMPOTENT_EXTENSION: True, UNLIMITED_EXTENSION: True},
         )
-        self.__parse_token_response(response.json())
+        return self.__parse_token_response(load_json(response))
 
-    async def __get_connection(self):
-        access_token = await self.get_access_token()
+    async def _get_connection(self) -> KeycloakClient:
+        return self.__connection
 
-        def auth_interceptor(request: httpx.Request) -> httpx.Request:
-            request.headers["Authorization"] = f"Bearer {access_token}"
-            return request
 
-        self.__connection.auth = auth_interceptor
-        return self.__connection
+class KeycloakAdminRealm(_RealmResources):
+    """View of a ``KeycloakAdmin`` managing another realm.
+
+    It shares the connection pool and token of the ``KeycloakAdmin`` it was
+    created from. Only the urls of its resources point to another realm.
+
+    .. code:: python
+
+        from keycloak_admin_aio import KeycloakAdmin, KeycloakAdminRealm
+
+        kc: KeycloakAdmin  # needs to be instantiated
+        tenant: KeycloakAdminRealm = kc.for_realm("tenant-a")
+        user_count: int = await tenant.users.count()
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        realm: str,
+        get_connection: GetConnectionFn,
+        handle_cache: Optional[HandleCache] = None,
+    ):
+        """Should not be used directly. Use ``KeycloakAdmin.for_realm``."""
+        self._server_url = server_url
+        self._realm = realm
+        self._get_connection = get_connection
+        self._handle_cache = handle_cache
+
+    @property
+    def realm(self):
+        """Realm managed by this view."""
+        return self._realm
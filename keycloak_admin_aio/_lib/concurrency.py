@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_concurrently(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[asyncio.Future[T]]:
+    """Runs the awaitables created by ``factories`` with bounded concurrency.
+
+    At most ``concurrency`` awaitables are in flight. Finished futures are
+    yielded in completion order or, if ``ordered``, in the order of
+    ``factories``. The next awaitables are started before a future is yielded,
+    so they run while the consumer processes it. Futures still running when
+    the consumer stops iterating are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("'concurrency' needs to be at least 1")
+    remaining = iter(factories)
+    running: list[asyncio.Future[T]] = []
+
+    def start():
+        while len(running) < concurrency:
+            factory = next(remaining, None)
+            if factory is None:
+                return
+            running.append(asyncio.ensure_future(factory()))
+
+    try:
+        start()
+        while running:
+            if ordered:
+                await asyncio.wait([running[0]])
+                finished = [running.pop(0)]
+            else:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                finished = [future for future in running if future in done]
+                running[:] = [future for future in running if future not in done]
+            start()
+            for future in finished:
+                yield future
+    finally:
+        for future in running:
+            future.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
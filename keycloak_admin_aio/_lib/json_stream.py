@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+from keycloak_admin_aio._client import ResourceConnection
+
+T = TypeVar("T")
+
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+class JsonArrayParser:
+    """Parses the elements of a JSON array from chunks of its UTF-8 encoding.
+
+    Elements are returned by ``feed`` as soon as they are complete. Only the
+    text of the element being received is buffered.
+    """
+
+    def __init__(self):
+        self._decode_utf8 = codecs.getincrementaldecoder("utf-8")().decode
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._state = "start"
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk and get the elements completed by it."""
+        self._buffer += self._decode_utf8(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Get the remaining elements. Raises ``ValueError`` if the array is incomplete."""
+        self._buffer += self._decode_utf8(b"", final=True)
+        elements = self._parse(final=True)
+        if self._state != "end":
+            raise ValueError("Incomplete JSON array")
+        return elements
+
+    def _parse(self, final: bool) -> list[Any]:
+        elements = []
+        buffer = self._buffer
+        position = 0
+        while True:
+            position = _whitespace.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            if self._state == "start":
+                if buffer[position] != "[":
+                    raise ValueError("Expected a JSON array")
+                position += 1
+                self._state = "first"
+            elif self._state == "first" and buffer[position] == "]":
+                position += 1
+                self._state = "end"
+            elif self._state in ("first", "element"):
+                try:
+                    element, end = self._raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if not final:
+                    # a number might continue in the next chunk, so the
+                    # element is only taken once its delimiter arrived
+                    delimiter = _whitespace.match(buffer, end).end()
+                    if delimiter == len(buffer) or buffer[delimiter] not in ",]":
+                        break
+                elements.append(element)
+                position = end
+                self._state = "separator"
+            elif self._state == "separator":
+                if buffer[position] == ",":
+                    self._state = "element"
+                elif buffer[position] == "]":
+                    self._state = "end"
+                else:
+                    raise ValueError("Expected ',' or ']' in JSON array")
+                position += 1
+            else:
+                raise ValueError("Unexpected data after JSON array")
+        self._buffer = buffer[position:]
+        return elements
+
+
+async def stream_list(
+    connection: ResourceConnection,
+    url: str,
+    params: dict[str, Any],
+    parse: Callable[[Any], T],
+) -> AsyncIterator[T]:
+    """Request a list with a ``GET`` and yield its parsed items while they arrive."""
+    async with connection.stream("GET", url, params=params) as response:
+        parser = JsonArrayParser()
+        async for chunk in response.aiter_bytes():
+            for element in parser.feed(chunk):
+                yield parse(element)
+        for element in parser.close():
+            yield parse(element)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import itertools
+from typing import AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+from .concurrency import run_concurrently
+
+T = TypeVar("T")
+
+GetPageFn = Callable[[int, int], Awaitable[Iterable[T]]]
+"""Fetches the page of ``max`` items starting at ``first``."""
+
+
+async def iterate_pages(get_page: GetPageFn[T], page_size: int) -> AsyncIterator[T]:
+    """Yields the items of consecutive pages until a page comes back short."""
+    if page_size < 1:
+        raise ValueError("'page_size' needs to be at least 1")
+    first = 0
+    while True:
+        item_count = 0
+        for item in await get_page(first, page_size):
+            item_count += 1
+            yield item
+        if item_count < page_size:
+            return
+        first += page_size
+
+
+async def prefetch_pages(
+    get_page: GetPageFn[T], page_size: int, prefetch: int
+) -> AsyncIterator[T]:
+    """Like ``iterate_pages`` but fetches the next ``prefetch`` pages in advance.
+
+    The pages following the one being consumed are requested concurrently.
+    Requests for pages past the last one are cancelled once a page comes
+    back short.
+    """
+    if page_size < 1:
+        raise ValueError("'page_size' needs to be at least 1")
+    if prefetch < 1:
+        raise ValueError("'prefetch' needs to be at least 1")
+    factories = (
+        lambda first=first: get_page(first, page_size)
+        for first in itertools.count(0, page_size)
+    )
+    pages = run_concurrently(factories, prefetch, ordered=True)
+    try:
+        async for page in pages:
+            item_count = 0
+            for item in page.result():
+                item_count += 1
+                yield item
+            if item_count < page_size:
+                return
+    finally:
+        await pages.aclose()
+
+
+async def fetch_pages_concurrently(
+    count: Callable[[], Awaitable[int]],
+    get_page: GetPageFn[T],
+    page_size: int,
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[T]:
+    """Fetches all pages of a result of known size concurrently.
+
+    ``count`` is awaited first to determine the pages to fetch. At most
+    ``concurrency`` pages are requested at a time, their items are yielded in
+    page order if ``ordered`` or else as soon as a page arrives. Items added
+    after counting are not fetched.
+    """
+    if page_size < 1:
+        raise ValueError("'page_size' needs to be at least 1")
+    total = await count()
+    factories = (
+        lambda first=first: get_page(first, page_size)
+        for first in range(0, total, page_size)
+    )
+    pages = run_concurrently(factories, concurrency, ordered=ordered)
+    try:
+        async for page in pages:
+            for item in page.result():
+                yield item
+    finally:
+        await pages.aclose()
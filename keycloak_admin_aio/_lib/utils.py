@@ -1,9 +1,10 @@
 import uuid
-from dataclasses import asdict as _asdict
-from typing import Any, Optional, TypeVar, Union
+from typing import Any, Literal, Optional, Sequence, TypeVar, Union
 
 import httpx
 
+from keycloak_admin_aio._json_codec import load_json
+
 
 def remove_none(dictionary: dict[str, Any]) -> dict[str, Any]:
     def recurse(value: Union[dict, Any]):
@@ -15,8 +16,65 @@ def remove_none(dictionary: dict[str, Any]) -> dict[str, Any]:
     return {k: recurse(v) for k, v in dictionary.items() if v is not None}
 
 
-def asdict(dataclass) -> dict[str, Any]:
-    return remove_none(_asdict(dataclass))
+RawFormat = Literal["json", "bytes"]
+
+
+def parse_list(
+    response: httpx.Response,
+    representation: Any,
+    raw: Optional[RawFormat],
+    intern: Any = False,
+    lazy: bool = False,
+    fields: Optional[Sequence[str]] = None,
+):
+    """Parse a list response into ``representation`` instances.
+
+    With ``raw="json"`` the decoded JSON and with ``raw="bytes"`` the
+    response body is returned instead, without creating any dataclasses.
+    With ``lazy`` an iterator creating the instances on demand is returned.
+    ``intern`` is passed on to ``from_list``. With ``fields`` records of
+    only these fields are created instead (see ``project_list``).
+    """
+    if raw == "bytes":
+        return response.content
+    if raw == "json":
+        return load_json(response)
+    if fields is not None:
+        return representation.project_list(load_json(response), fields, intern=intern)
+    if lazy:
+        return representation.iter_list(load_json(response), intern=intern)
+    return representation.from_list(load_json(response), intern=intern)
+
+
+USER_BRIEF_REPRESENTATION_FIELDS = frozenset(
+    (
+        "id",
+        "username",
+        "createdTimestamp",
+        "firstName",
+        "lastName",
+        "email",
+        "enabled",
+        "emailVerified",
+        "federationLink",
+    )
+)
+"""Fields of users included by Keycloak with ``briefRepresentation=true``."""
+
+
+def brief_representation_for(
+    brief_representation: Optional[bool],
+    fields: Optional[Sequence[str]],
+    brief_fields: frozenset[str],
+) -> Optional[bool]:
+    """Request the brief representation if it holds all of ``fields``.
+
+    An explicitly passed ``brief_representation`` is kept.
+    """
+    if brief_representation is None and fields is not None:
+        if brief_fields.issuperset(fields):
+            return True
+    return brief_representation
 
 
 def is_uuid(value: str) -> bool:
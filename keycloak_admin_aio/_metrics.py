@@ -0,0 +1,149 @@
+from dataclasses import dataclass, field
+
+import httpx
+
+
+@dataclass
+class TokenLockMetrics:
+    """Counters describing contention on the ``access_token`` lock.
+
+    .. code:: python
+
+        kc: KeycloakAdmin  # needs to be instantiated
+
+        print(kc.token_lock_metrics.fast_path_hits)
+        print(kc.token_lock_metrics.max_lock_wait)
+    """
+
+    fast_path_hits: int = 0
+    """Calls which returned the cached token without acquiring the lock."""
+
+    lock_acquisitions: int = 0
+    """Calls which had to acquire the lock because the token was expired."""
+
+    total_lock_wait: float = 0.0
+    """Seconds spent waiting for the lock summed over all acquisitions."""
+
+    max_lock_wait: float = 0.0
+    """Longest single wait for the lock in seconds."""
+
+    def record_lock_wait(self, seconds: float):
+        self.lock_acquisitions += 1
+        self.total_lock_wait += seconds
+        if seconds > self.max_lock_wait:
+            self.max_lock_wait = seconds
+
+    @property
+    def mean_lock_wait(self) -> float:
+        """Mean seconds waited for the lock per acquisition."""
+        if not self.lock_acquisitions:
+            return 0.0
+        return self.total_lock_wait / self.lock_acquisitions
+
+
+@dataclass
+class HandleCacheMetrics:
+    """Counters of the cache of resource handles returned by ``by_id`` and alike.
+
+    Only counted if ``KeycloakAdmin`` was created with a ``handle_cache_size``.
+
+    .. code:: python
+
+        kc = KeycloakAdmin.with_password(..., handle_cache_size=1024)
+        ...
+        print(kc.handle_cache_metrics.hit_rate)
+    """
+
+    hits: int = 0
+    """Calls which returned a cached handle."""
+
+    misses: int = 0
+    """Calls which created a new handle."""
+
+    evictions: int = 0
+    """Handles dropped as the cache was full."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of calls which returned a cached handle."""
+        calls = self.hits + self.misses
+        if not calls:
+            return 0.0
+        return self.hits / calls
+
+
+@dataclass
+class RetryMetrics:
+    """Counters of the retries made according to the ``RetryPolicy``.
+
+    .. code:: python
+
+        kc: KeycloakAdmin  # needs to be instantiated with a retry_policy
+
+        print(kc.retry_metrics.retries, kc.retry_metrics.retries_by_reason)
+    """
+
+    retries: int = 0
+    """Requests sent again after a failed attempt."""
+
+    retries_by_reason: dict[str, int] = field(default_factory=dict)
+    """Retries by response status like ``"503"`` or error like ``"ConnectError"``."""
+
+    exhausted: int = 0
+    """Requests which failed after ``max_attempts`` attempts."""
+
+    total_backoff: float = 0.0
+    """Seconds waited before retries summed over all retries."""
+
+    def record_retry(self, error: Exception, delay: float):
+        reason = (
+            str(error.response.status_code)
+            if isinstance(error, httpx.HTTPStatusError)
+            else type(error).__name__
+        )
+        self.retries += 1
+        self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+        self.total_backoff += delay
+
+
+@dataclass
+class RateLimitMetrics:
+    """Queue of the requests waiting to be admitted by a ``RateLimit``.
+
+    .. code:: python
+
+        kc: KeycloakAdmin  # needs to be instantiated with a rate_limit
+
+        print(kc.rate_limit_metrics.waiting, kc.rate_limit_metrics.mean_wait)
+    """
+
+    waiting: int = 0
+    """Requests currently waiting to be admitted."""
+
+    max_waiting: int = 0
+    """Most requests waiting at the same time."""
+
+    in_flight: int = 0
+    """Requests currently admitted and not yet completed."""
+
+    admitted: int = 0
+    """Requests admitted in total."""
+
+    total_wait: float = 0.0
+    """Seconds waited for admission summed over all requests."""
+
+    max_wait: float = 0.0
+    """Longest single wait for admission in seconds."""
+
+    def record_wait(self, seconds: float):
+        self.admitted += 1
+        self.total_wait += seconds
+        if seconds > self.max_wait:
+            self.max_wait = seconds
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean seconds waited for admission per request."""
+        if not self.admitted:
+            return 0.0
+        return self.total_wait / self.admitted
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from ._metrics import RateLimitMetrics
+
+RESOURCE_EXTENSION = "keycloak_admin_aio.resource"
+"""Class of the resource which sent a request, used to look up its ``RateLimit``."""
+
+UNLIMITED_EXTENSION = "keycloak_admin_aio.unlimited"
+"""Marks a request which is admitted without waiting, like token requests.
+
+Token requests are sent while another request is being admitted, so they
+must not wait for that request's slot.
+"""
+
+
+@dataclass
+class RateLimit:
+    """Limits the requests sent to Keycloak.
+
+    Requests exceeding the limits wait in a queue until they are admitted,
+    they don't fail. ``requests_per_second`` is enforced by a token bucket
+    holding up to ``burst`` tokens, ``max_in_flight`` limits the requests
+    awaiting their response at the same time.
+
+    Limits of single resources are given in ``resource_rate_limits`` by
+    their path from ``KeycloakAdmin``, like ``"users.by_id"``, or by their
+    class.
+
+    .. code:: python
+
+        from keycloak_admin_aio import KeycloakAdmin, RateLimit
+
+        kc = KeycloakAdmin.with_password(
+            ...,  # provide credentials
+            rate_limit=RateLimit(requests_per_second=200, max_in_flight=50),
+            resource_rate_limits={"users.by_id": RateLimit(max_in_flight=10)},
+        )
+    """
+
+    requests_per_second: Optional[float] = None
+    """Mean rate of admitted requests. ``None`` for no limit."""
+
+    burst: Optional[int] = None
+    """Requests admitted at once after being idle. Defaults to ``requests_per_second``."""
+
+    max_in_flight: Optional[int] = None
+    """Requests sent concurrently. ``None`` for no limit."""
+
+
+class RateLimiter:
+    """Admits requests according to a ``RateLimit``."""
+
+    def __init__(self, rate_limit: RateLimit):
+        self.metrics = RateLimitMetrics()
+        self._rate = rate_limit.requests_per_second
+        self._capacity = float(rate_limit.burst or max(int(self._rate or 1), 1))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._semaphore = (
+            asyncio.Semaphore(rate_limit.max_in_flight)
+            if rate_limit.max_in_flight
+            else None
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Wait until a request is admitted, which lasts until the context is left."""
+        metrics = self.metrics
+        wait_start = time.perf_counter()
+        metrics.waiting += 1
+        if metrics.waiting > metrics.max_waiting:
+            metrics.max_waiting = metrics.waiting
+        try:
+            # the token is taken first, so requests waiting for it don't
+            # occupy a slot of max_in_flight without being sent
+            if self._rate:
+                await self._take_token(self._rate)
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+        finally:
+            metrics.waiting -= 1
+        metrics.record_wait(time.perf_counter() - wait_start)
+        metrics.in_flight += 1
+        try:
+            yield
+        finally:
+            metrics.in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def _take_token(self, rate: float):
+        """Takes a token from the bucket, waiting until it is refilled if empty.
+
+        Tokens are reserved in advance, the balance becoming negative, so
+        waiting requests are admitted in the order they arrived.
+        """
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / rate)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
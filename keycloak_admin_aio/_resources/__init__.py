@@ -1,18 +1,56 @@
-"""This package provides classes for Keycloak resources."""
+"""This package provides classes for Keycloak resources.
+
+The resources of a realm are imported on first access, so importing
+``keycloak_admin_aio`` does not import the whole resource tree.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .keycloak_resource import (
     KeycloakResource,
     AttachedResources,
     KeycloakResourceWithIdentifier,
     KeycloakResourceWithIdentifierGetter,
+    KeycloakResourceWithPagination,
+    LazyResource,
+    attach_lazily,
+    get_resource_class,
 )
 
-from .admin_events import AdminEvents
-from .authentication import Authentication
-from .client_scopes import ClientScopes
-from .clients import Clients
-from .groups import Groups
-from .roles import Roles
-from .users import Users
-from .sessions import Sessions
-from .attack_detection import AttackDetection
+if TYPE_CHECKING:
+    from .admin_events import AdminEvents
+    from .authentication import Authentication
+    from .client_scopes import ClientScopes
+    from .clients import Clients
+    from .groups import Groups
+    from .roles import Roles
+    from .users import Users
+    from .sessions import Sessions
+    from .attack_detection import AttackDetection
+
+_lazy_resources = {
+    "AdminEvents": ".admin_events",
+    "Authentication": ".authentication",
+    "ClientScopes": ".client_scopes",
+    "Clients": ".clients",
+    "Groups": ".groups",
+    "Roles": ".roles",
+    "Users": ".users",
+    "Sessions": ".sessions",
+    "AttackDetection": ".attack_detection",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _lazy_resources[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    resource = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = resource
+    return resource
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_lazy_resources]
@@ -1,12 +1,45 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
+from keycloak_admin_aio._json_codec import load_json
+from keycloak_admin_aio._lib.json_stream import stream_list
 from keycloak_admin_aio._lib.utils import remove_none
 from keycloak_admin_aio.types import OperationType, ResourceType
 
-from .. import KeycloakResource
+from .. import KeycloakResourceWithPagination
 
 
-class AdminEvents(KeycloakResource):
+def _get_params(
+    auth_client: Optional[str],
+    auth_ip_address: Optional[str],
+    auth_realm: Optional[str],
+    auth_user: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    first: Optional[int],
+    max: Optional[int],
+    operation_types: Optional[list[OperationType]],
+    resource_path: Optional[str],
+    resource_types: Optional[list[ResourceType]],
+) -> dict[str, Any]:
+    """Query parameters shared by ``AdminEvents.get`` and ``AdminEvents.stream``."""
+    return remove_none(
+        {
+            "authClient": auth_client,
+            "authIpAddress": auth_ip_address,
+            "authRealm": auth_realm,
+            "authUser": auth_user,
+            "dateFrom": date_from,
+            "dateTo": date_to,
+            "first": first,
+            "max": max,
+            "operationTypes": operation_types,
+            "resourcePath": resource_path,
+            "resourceTypes": resource_types,
+        }
+    )
+
+
+class AdminEvents(KeycloakResourceWithPagination[dict]):
     """Provides the Keycloak admin events resource.
 
     .. code:: python
@@ -40,20 +73,61 @@ class AdminEvents(KeycloakResource):
             events: list[dict] = await kc.admin_events.get()
         """
         connection = await self._get_connection()
-        params = remove_none(
-            {
-                "authClient": auth_client,
-                "authIpAddress": auth_ip_address,
-                "authRealm": auth_realm,
-                "authUser": auth_user,
-                "dateFrom": date_from,
-                "dateTo": date_to,
-                "first": first,
-                "max": max,
-                "operationTypes": operation_types,
-                "resourcePath": resource_path,
-                "resourceTypes": resource_types,
-            }
+        params = _get_params(
+            auth_client,
+            auth_ip_address,
+            auth_realm,
+            auth_user,
+            date_from,
+            date_to,
+            first,
+            max,
+            operation_types,
+            resource_path,
+            resource_types,
         )
         response = await connection.get(self.get_url(), params=params)
-        return response.json()
+        return load_json(response)
+
+    async def stream(
+        self,
+        auth_client: Optional[str] = None,
+        auth_ip_address: Optional[str] = None,
+        auth_realm: Optional[str] = None,
+        auth_user: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        operation_types: Optional[list[OperationType]] = None,
+        resource_path: Optional[str] = None,
+        resource_types: Optional[list[ResourceType]] = None,
+    ) -> AsyncIterator[dict]:
+        """Stream admin events as they arrive.
+
+        Unlike ``get`` the response is neither buffered nor decoded as a
+        whole, only the item being received is held in memory.
+
+        .. code:: python
+
+            async for event in kc.admin_events.stream(max=100000):
+                ...
+        """
+        connection = await self._get_connection()
+        params = _get_params(
+            auth_client,
+            auth_ip_address,
+            auth_realm,
+            auth_user,
+            date_from,
+            date_to,
+            first,
+            max,
+            operation_types,
+            resource_path,
+            resource_types,
+        )
+        async for event in stream_list(
+            connection, self.get_url(), params, lambda event: event
+        ):
+            yield event
@@ -1,5 +1,7 @@
 from typing import Any
 
+from keycloak_admin_aio._json_codec import load_json
+
 from ..... import KeycloakResourceWithIdentifier
 
 
@@ -26,7 +28,7 @@ class UsersByIdBruteForceDetection(KeycloakResourceWithIdentifier):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return response.json()
+        return load_json(response)
 
     async def delete(self):
         """Clear login failures for the user.
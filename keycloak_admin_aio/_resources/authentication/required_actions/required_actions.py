@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import RequiredActionProviderRepresentation
 
 from ... import KeycloakResource
@@ -27,4 +28,4 @@ class AuthenticationRequiredActions(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return RequiredActionProviderRepresentation.from_list(response.json())
+        return RequiredActionProviderRepresentation.from_list(load_json(response))
@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import ClientScopeRepresentation
 
 from ... import AttachedResources, KeycloakResourceWithIdentifier
@@ -32,7 +33,7 @@ class ClientScopesById(KeycloakResourceWithIdentifier):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return ClientScopeRepresentation.from_dict(response.json())
+        return ClientScopeRepresentation.from_dict(load_json(response))
 
     async def update(
         self,
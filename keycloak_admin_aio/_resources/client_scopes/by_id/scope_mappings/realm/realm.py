@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import RoleRepresentation
 
 from ..... import KeycloakResource
@@ -41,7 +42,7 @@ class ClientScopesScopeMappingsRealm(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return RoleRepresentation.from_list(response.json())
+        return RoleRepresentation.from_list(load_json(response))
 
     async def delete(self, role_representations: list[RoleRepresentation]):
         """Remove roles from realm scope mappings for a client scope by id.
@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio._lib.utils import get_resource_id_in_location_header
 from keycloak_admin_aio.types import ClientScopeRepresentation
 
@@ -46,4 +47,4 @@ class ClientScopes(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return ClientScopeRepresentation.from_list(response.json())
+        return ClientScopeRepresentation.from_list(load_json(response))
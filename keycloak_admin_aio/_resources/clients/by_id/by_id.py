@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import ClientRepresentation
 
 from ... import AttachedResources, KeycloakResourceWithIdentifier
@@ -35,7 +36,7 @@ class ClientsById(KeycloakResourceWithIdentifier):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return ClientRepresentation.from_dict(response.json())
+        return ClientRepresentation.from_dict(load_json(response))
 
     async def update(self, client_representation: ClientRepresentation):
         """Update a client by UUID.
@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import ClientScopeRepresentation
 
 from .... import (
@@ -39,4 +40,4 @@ class ClientsByIdDefaultClientScopes(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return ClientScopeRepresentation.from_list(response.json())
+        return ClientScopeRepresentation.from_list(load_json(response))
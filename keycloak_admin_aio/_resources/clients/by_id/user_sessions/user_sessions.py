@@ -1,12 +1,13 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Iterator, Literal, Optional, Union, overload
 
-from keycloak_admin_aio._lib.utils import remove_none
+from keycloak_admin_aio._lib.json_stream import stream_list
+from keycloak_admin_aio._lib.utils import RawFormat, parse_list, remove_none
 from keycloak_admin_aio.types.types import UserSession
 
-from .... import KeycloakResource
+from .... import KeycloakResourceWithPagination
 
 
-class ClientsByIdUserSessions(KeycloakResource):
+class ClientsByIdUserSessions(KeycloakResourceWithPagination[UserSession]):
     """User sessions for clients by id.
 
     .. code:: python
@@ -20,16 +21,82 @@ class ClientsByIdUserSessions(KeycloakResource):
     def get_url(self) -> str:
         return f"{self._get_parent_url()}/user-sessions"
 
+    @overload
     async def get(
-        self, first: Optional[int] = None, max: Optional[int] = None
-    ) -> list[UserSession]:
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: None = None,
+        lazy: Literal[False] = False,
+    ) -> list[UserSession]: ...
+
+    @overload
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: None = None,
+        lazy: Literal[True],
+    ) -> Iterator[UserSession]: ...
+
+    @overload
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: Optional[RawFormat] = None,
+        lazy: bool = False,
+    ) -> Union[list[UserSession], Iterator[UserSession], list[dict[str, Any]], bytes]:
         """Get user sessions for a client.
 
         .. code:: python
 
             user_sessions: lists[UserSession] = await kc.clients.by_id(client_uuid).user_sessions.get()
+            user_sessions_json: list[dict] = await kc.clients.by_id(client_uuid).user_sessions.get(raw="json")
         """
         connection = await self._get_connection()
         params = remove_none({"first": first, "max": max})
         response = await connection.get(self.get_url(), params=params)
-        return UserSession.from_list(response.json())
+        return parse_list(response, UserSession, raw, lazy=lazy)
+
+    async def stream(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+    ) -> AsyncIterator[UserSession]:
+        """Stream user sessions of a client as they arrive.
+
+        Unlike ``get`` the response is neither buffered nor decoded as a
+        whole, only the item being received is held in memory.
+
+        .. code:: python
+
+            async for user_session in kc.clients.by_id(client_uuid).user_sessions.stream():
+                ...
+        """
+        connection = await self._get_connection()
+        params = remove_none({"first": first, "max": max})
+        async for user_session in stream_list(
+            connection, self.get_url(), params, UserSession.from_dict
+        ):
+            yield user_session
@@ -1,16 +1,22 @@
-from typing import Optional
+from typing import Any, Iterator, Literal, Optional, Sequence, Union, overload
 
 from keycloak_admin_aio._lib.utils import (
+    RawFormat,
     get_resource_id_in_location_header,
+    parse_list,
     remove_none,
 )
 from keycloak_admin_aio.types import ClientRepresentation
 
-from .. import AttachedResources, KeycloakResource, KeycloakResourceWithIdentifierGetter
+from .. import (
+    AttachedResources,
+    KeycloakResourceWithIdentifierGetter,
+    KeycloakResourceWithPagination,
+)
 from .by_id import ClientsById
 
 
-class Clients(KeycloakResource):
+class Clients(KeycloakResourceWithPagination[ClientRepresentation]):
     """Provides the Keycloak clients resource.
 
     .. code:: python
@@ -40,6 +46,77 @@ class Clients(KeycloakResource):
         )
         return get_resource_id_in_location_header(response)
 
+    @overload
+    async def get(
+        self,
+        client_id: Optional[str] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        q: Optional[str] = None,
+        search: Optional[bool] = False,
+        viewable_only: Optional[bool] = False,
+        *,
+        raw: None = None,
+        lazy: Literal[False] = False,
+        fields: None = None,
+    ) -> list[ClientRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        client_id: Optional[str] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        q: Optional[str] = None,
+        search: Optional[bool] = False,
+        viewable_only: Optional[bool] = False,
+        *,
+        raw: None = None,
+        lazy: Literal[False] = False,
+        fields: Sequence[str],
+    ) -> list[Any]: ...
+
+    @overload
+    async def get(
+        self,
+        client_id: Optional[str] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        q: Optional[str] = None,
+        search: Optional[bool] = False,
+        viewable_only: Optional[bool] = False,
+        *,
+        raw: None = None,
+        lazy: Literal[True],
+        fields: None = None,
+    ) -> Iterator[ClientRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        client_id: Optional[str] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        q: Optional[str] = None,
+        search: Optional[bool] = False,
+        viewable_only: Optional[bool] = False,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get(
+        self,
+        client_id: Optional[str] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        q: Optional[str] = None,
+        search: Optional[bool] = False,
+        viewable_only: Optional[bool] = False,
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
     async def get(
         self,
         client_id: Optional[str] = None,
@@ -48,12 +125,24 @@ class Clients(KeycloakResource):
         q: Optional[str] = None,
         search: Optional[bool] = False,
         viewable_only: Optional[bool] = False,
-    ) -> list[ClientRepresentation]:
+        *,
+        raw: Optional[RawFormat] = None,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[
+        list[ClientRepresentation],
+        Iterator[ClientRepresentation],
+        list[dict[str, Any]],
+        list[Any],
+        bytes,
+    ]:
         """Get clients.
 
         .. code:: python
 
             clients: list[ClientRepresentation] = await kc.clients.get()
+            clients_body: bytes = await kc.clients.get(raw="bytes")
+            client_records = await kc.clients.get(fields=["id", "clientId"])
         """
         connection = await self._get_connection()
         params = remove_none(
@@ -67,4 +156,4 @@ class Clients(KeycloakResource):
             }
         )
         response = await connection.get(self.get_url(), params=params)
-        return ClientRepresentation.from_list(response.json())
+        return parse_list(response, ClientRepresentation, raw, lazy=lazy, fields=fields)
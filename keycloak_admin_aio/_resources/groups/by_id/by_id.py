@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import GroupRepresentation
 
 from ... import AttachedResources, KeycloakResourceWithIdentifier
@@ -35,7 +36,7 @@ class GroupsById(KeycloakResourceWithIdentifier):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return GroupRepresentation.from_dict(response.json())
+        return GroupRepresentation.from_dict(load_json(response))
 
     async def update(self, group_representation: GroupRepresentation):
         """Update a group by id.
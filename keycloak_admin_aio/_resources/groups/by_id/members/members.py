@@ -1,12 +1,41 @@
-from typing import Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
-from keycloak_admin_aio._lib.utils import remove_none
-from keycloak_admin_aio.types import UserRepresentation
+from keycloak_admin_aio._lib.json_stream import stream_list
+from keycloak_admin_aio._lib.utils import (
+    USER_BRIEF_REPRESENTATION_FIELDS,
+    RawFormat,
+    brief_representation_for,
+    parse_list,
+    remove_none,
+)
+from keycloak_admin_aio.types import StringTable, UserRepresentation
 
-from .... import KeycloakResource
+from .... import KeycloakResourceWithPagination
 
 
-class GroupsByIdMembers(KeycloakResource):
+def _get_params(
+    brief_representation: Optional[bool], first: Optional[int], max: Optional[int]
+) -> dict[str, Any]:
+    """Query parameters shared by ``GroupsByIdMembers.get`` and ``GroupsByIdMembers.stream``."""
+    return remove_none(
+        {
+            "briefRepresentation": brief_representation,
+            "first": first,
+            "max": max,
+        }
+    )
+
+
+class GroupsByIdMembers(KeycloakResourceWithPagination[UserRepresentation]):
     """Members of groups by id.
 
     .. code:: python
@@ -20,25 +49,120 @@ class GroupsByIdMembers(KeycloakResource):
     def get_url(self) -> str:
         return f"{self._get_parent_url()}/members"
 
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: None = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: Literal[False] = False,
+        fields: None = None,
+    ) -> list[UserRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: None = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: Literal[False] = False,
+        fields: Sequence[str],
+    ) -> list[Any]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: None = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: Literal[True],
+        fields: None = None,
+    ) -> Iterator[UserRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
     async def get(
         self,
         brief_representation: Optional[bool] = None,
         first: Optional[int] = None,
         max: Optional[int] = None,
-    ) -> list[UserRepresentation]:
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        *,
+        raw: Optional[RawFormat] = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[
+        list[UserRepresentation],
+        Iterator[UserRepresentation],
+        list[dict[str, Any]],
+        list[Any],
+        bytes,
+    ]:
         """Get members of a group by id.
 
         .. code:: python
 
             members: list[UserRepresentation] = await kc.groups.by_id(group_id).members.get()
+            members_json: list[dict] = await kc.groups.by_id(group_id).members.get(raw="json")
+            members_sharing_strings = await kc.groups.by_id(group_id).members.get(intern=True)
+            member_records = await kc.groups.by_id(group_id).members.get(fields=["id", "email"])
         """
         connection = await self._get_connection()
-        params = remove_none(
-            {
-                "briefRepresentation": brief_representation,
-                "first": first,
-                "max": max,
-            }
+        brief_representation = brief_representation_for(
+            brief_representation, fields, USER_BRIEF_REPRESENTATION_FIELDS
         )
+        params = _get_params(brief_representation, first, max)
         response = await connection.get(self.get_url(), params=params)
-        return UserRepresentation.from_list(response.json())
+        return parse_list(
+            response, UserRepresentation, raw, intern, lazy=lazy, fields=fields
+        )
+
+    async def stream(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+    ) -> AsyncIterator[UserRepresentation]:
+        """Stream members of a group by id as they arrive.
+
+        Unlike ``get`` the response is neither buffered nor decoded as a
+        whole, only the item being received is held in memory.
+
+        .. code:: python
+
+            async for member in kc.groups.by_id(group_id).members.stream():
+                ...
+        """
+        connection = await self._get_connection()
+        params = _get_params(brief_representation, first, max)
+        async for member in stream_list(
+            connection, self.get_url(), params, UserRepresentation.from_dict
+        ):
+            yield member
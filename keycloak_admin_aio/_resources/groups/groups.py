@@ -1,16 +1,33 @@
-from typing import Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
 
+from keycloak_admin_aio._json_codec import load_json
+from keycloak_admin_aio._lib.pagination import fetch_pages_concurrently
 from keycloak_admin_aio._lib.utils import (
+    RawFormat,
     get_resource_id_in_location_header,
+    parse_list,
     remove_none,
 )
-from keycloak_admin_aio.types import GroupRepresentation
+from keycloak_admin_aio.types import Columns, GroupRepresentation
 
-from .. import AttachedResources, KeycloakResource, KeycloakResourceWithIdentifierGetter
+from .. import (
+    AttachedResources,
+    KeycloakResourceWithIdentifierGetter,
+    KeycloakResourceWithPagination,
+)
 from .by_id import GroupsById
 
 
-class Groups(KeycloakResource):
+class Groups(KeycloakResourceWithPagination[GroupRepresentation]):
     """Provides the Keycloak group resource
 
     .. code:: python
@@ -26,18 +43,73 @@ class Groups(KeycloakResource):
     def get_url(self) -> str:
         return f"{self._get_parent_url()}/groups"
 
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: None = None,
+        lazy: Literal[False] = False,
+    ) -> list[GroupRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: None = None,
+        lazy: Literal[True],
+    ) -> Iterator[GroupRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
     async def get(
         self,
         brief_representation: Optional[bool] = None,
         first: Optional[int] = None,
         max: Optional[int] = None,
         search: Optional[str] = None,
-    ) -> list[GroupRepresentation]:
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: Optional[RawFormat] = None,
+        lazy: bool = False,
+    ) -> Union[
+        list[GroupRepresentation],
+        Iterator[GroupRepresentation],
+        list[dict[str, Any]],
+        bytes,
+    ]:
         """Get groups.
 
         .. code:: python
 
             groups: list[GroupRepresentation] = await kc.groups.get()
+            groups_json: list[dict] = await kc.groups.get(raw="json")
         """
         connection = await self._get_connection()
         params = remove_none(
@@ -49,7 +121,7 @@ class Groups(KeycloakResource):
             }
         )
         response = await connection.get(self.get_url(), params=params)
-        return GroupRepresentation.from_list(response.json())
+        return parse_list(response, GroupRepresentation, raw, lazy=lazy)
 
     async def create(self, group_representation: GroupRepresentation) -> str:
         """Create a group.
@@ -77,4 +149,55 @@ class Groups(KeycloakResource):
         connection = await self._get_connection()
         params = remove_none({"search": search, "top": top})
         response = await connection.get(f"{self.get_url()}/count", params=params)
-        return response.json()["count"]
+        return load_json(response)["count"]
+
+    def scan_parallel(
+        self,
+        page_size: int = 100,
+        concurrency: int = 8,
+        ordered: bool = True,
+        search: Optional[str] = None,
+        **params: Any,
+    ) -> AsyncIterator[GroupRepresentation]:
+        """Iterate over all top level groups fetching their pages concurrently.
+
+        The top level group count determines the pages, of which at most
+        ``concurrency`` are requested at a time. Groups are yielded in page
+        order if ``ordered``, otherwise as soon as their page arrives.
+        ``params`` are passed on to ``get``.
+
+        .. code:: python
+
+            async for group in kc.groups.scan_parallel(ordered=False):
+                print(group.name)
+        """
+        return fetch_pages_concurrently(
+            lambda: self.count(search=search, top=True),
+            lambda first, max: self.get(first=first, max=max, search=search, **params),
+            page_size,
+            concurrency,
+            ordered,
+        )
+
+    async def scan_columns(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        page_size: int = 100,
+        prefetch: int = 2,
+        **params: Any,
+    ) -> Columns:
+        """Collect all groups into ``Columns`` instead of dataclasses.
+
+        The pages are fetched like with ``scan`` and their JSON is appended to
+        the columns as it is. See ``Columns`` for the stored ``fields``.
+        ``params`` are passed on to ``get``.
+
+        .. code:: python
+
+            columns = await kc.groups.scan_columns(fields=["id", "name", "path"])
+            print(len(columns), columns["name"][0])
+        """
+        columns = Columns(GroupRepresentation, fields)
+        async for group in self.scan(page_size, prefetch, raw="json", **params):
+            columns.append(group)
+        return columns
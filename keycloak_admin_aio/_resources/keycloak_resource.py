@@ -1,34 +1,128 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Awaitable, Callable, Generic, TypeVar
+import functools
+import importlib
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
-import httpx
+from keycloak_admin_aio._client import KeycloakClient, ResourceConnection
+from keycloak_admin_aio._lib.pagination import iterate_pages, prefetch_pages
+from keycloak_admin_aio._metrics import HandleCacheMetrics
 
-GetConnectionFn = Callable[..., Awaitable[httpx.AsyncClient]]
+GetConnectionFn = Callable[..., Awaitable[KeycloakClient]]
 GetUrlFn = Callable[..., str]
 
 
-def _create_getter(
-    resource: Any,
-    get_connection: GetConnectionFn,
-    get_url: GetUrlFn,
-):
-    """Creates a getter function for identified resources.
+class LazyResource:
+    """Descriptor attaching a child resource on first access.
 
-    This function creator helper is required as using a lambda as an inline
-    function leads to a reference problem with Python.
+    The resource (or a getter for identified resources) is created from the
+    owning instance's ``_get_client`` and ``get_url`` and stored in the
+    instance's ``__dict__``. As this is a non-data descriptor, later accesses
+    are plain attribute lookups.
+
+    ``resource`` may also be the name of a class exported by
+    ``keycloak_admin_aio._resources``, which defers importing its module to
+    the first access.
     """
-    return lambda identifier: resource(get_connection, get_url, identifier)
+
+    def __init__(self, name: str, resource: Union[type[KeycloakResource], str]):
+        self.name = name
+        self.resource = resource
+        self.is_identified: Optional[bool] = None
+
+    def _resolve(self) -> type[KeycloakResource]:
+        resource = self.resource
+        if isinstance(resource, str):
+            resource = self.resource = getattr(
+                importlib.import_module(__package__), resource
+            )
+        self.is_identified = issubclass(resource, KeycloakResourceWithIdentifier)
+        return resource
+
+    def __get__(self, instance: Any, owner: Any = None):
+        if instance is None:
+            return self
+        resource = self.resource if self.is_identified is not None else self._resolve()
+        if self.is_identified:
+            attached = KeycloakResourceWithIdentifierGetter(resource, instance)
+        else:
+            attached = resource(instance._get_client, instance.get_url)
+            attached._handle_cache = instance._handle_cache
+        instance.__dict__[self.name] = attached
+        return attached
+
+
+def get_resource_class(owner: type, path: str) -> type[KeycloakResource]:
+    """Get the class of the resource at the dotted ``path`` of attributes of ``owner``.
+
+    E.g. ``"users.by_id"`` of ``KeycloakAdmin`` is ``UsersById``. Only the
+    modules along the path are imported. Raises ``ValueError`` if there is
+    no resource at ``path``.
+    """
+    resource: Any = owner
+    for name in path.split("."):
+        lazy_resource = getattr(resource, name, None)
+        if not isinstance(lazy_resource, LazyResource):
+            raise ValueError(f"There is no resource at {path!r}")
+        resource = lazy_resource._resolve()
+    return resource
+
+
+def memoize_url(get_url: Callable[[Any], str]) -> Callable[[Any], str]:
+    """Wraps a ``get_url`` method to build the url only once per instance.
+
+    The url of a resource only depends on its parent's url and identifier,
+    which don't change after it was created. Hence building it again on each
+    request, which recurses up to ``KeycloakAdmin``, can be skipped.
+    """
+
+    @functools.wraps(get_url)
+    def memoized_get_url(self: Any) -> str:
+        try:
+            return self.__dict__["_url"]
+        except KeyError:
+            url = self.__dict__["_url"] = get_url(self)
+            return url
+
+    return memoized_get_url
+
+
+def attach_lazily(cls: type, resources: AttachedResources):
+    """Attaches ``resources`` to ``cls`` as ``LazyResource`` descriptors."""
+    for resource_name, resource in resources:
+        setattr(cls, resource_name, LazyResource(resource_name, resource))
 
 
 class KeycloakResource:
     """Base class for all Keycloak resources.
 
-    It attaches all the child resources in ``_keycloak_resources``
+    The child resources in ``_keycloak_resources`` are attached to each
+    subclass as ``LazyResource`` descriptors, so they are only created when
+    they are accessed on an instance. The ``get_url`` of each subclass is
+    memoized (see ``memoize_url``).
     """
 
     _keycloak_resources: AttachedResources
+    _handle_cache: Optional[HandleCache] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        if "_keycloak_resources" in cls.__dict__:
+            attach_lazily(cls, cls._keycloak_resources)
+        if "get_url" in cls.__dict__:
+            cls.get_url = memoize_url(cls.__dict__["get_url"])
 
     def __init__(
         self,
@@ -36,35 +130,21 @@ class KeycloakResource:
         get_parent_url: GetUrlFn,
     ):
         """Initialize keycloak resource."""
-        self._get_connection = get_connection
+        self._get_client = get_connection
         self._get_parent_url = get_parent_url
-        self.__set_keycloak_resources()
+
+    async def _get_connection(self) -> ResourceConnection:
+        """Get the connection sending requests on behalf of this resource class.
+
+        Requests are tagged with the class, which selects its ``RateLimit``.
+        """
+        client = await self._get_client()
+        return client.for_resource(type(self))
 
     @abc.abstractmethod
     def get_url(self) -> str:
         """Get the resource's url."""
 
-    def __set_keycloak_resources(self):
-        """Attaches all the specified child resources to the class instance.
-
-        On init this method will parse the list of ``_keycloak_resources``
-        attaching a getter for identified resources and a class instance for
-        others.
-        """
-        if not hasattr(self, "_keycloak_resources"):
-            return
-        for resources_name, resource in self._keycloak_resources:
-            if issubclass(resource, KeycloakResourceWithIdentifier):
-                setattr(
-                    self,
-                    resources_name,
-                    _create_getter(resource, self._get_connection, self.get_url),
-                )
-            else:
-                setattr(
-                    self, resources_name, resource(self._get_connection, self.get_url)
-                )
-
 
 class KeycloakResourceWithIdentifier(KeycloakResource):
     """Base class for all identified keycloak resources.
@@ -84,18 +164,139 @@ class KeycloakResourceWithIdentifier(KeycloakResource):
         self.identifier = identifier
 
 
-AttachedResources = list[tuple[str, type[KeycloakResource]]]
+TItem = TypeVar("TItem")
+
+
+class KeycloakResourceWithPagination(KeycloakResource, Generic[TItem]):
+    """Base class for Keycloak resources listing their items in pages.
+
+    The resource's ``get`` accepts ``first`` and ``max``. The methods of this
+    class call it repeatedly passing along any further filter arguments.
+    """
+
+    @abc.abstractmethod
+    async def get(
+        self, first: Optional[int] = None, max: Optional[int] = None, **params: Any
+    ) -> list[TItem]:
+        """Get a page of items."""
+
+    def iter(self, page_size: int = 100, **params: Any) -> AsyncIterator[TItem]:
+        """Iterate over all items fetching them page by page.
+
+        Only one page is held in memory at a time. The iteration stops after
+        the first page with fewer than ``page_size`` items. ``params`` are
+        passed on to ``get``.
+
+        .. code:: python
+
+            async for user in kc.users.iter(page_size=500, enabled=True):
+                print(user.username)
+        """
+        return iterate_pages(
+            lambda first, max: self.get(first=first, max=max, **params), page_size
+        )
+
+    def scan(
+        self, page_size: int = 100, prefetch: int = 2, **params: Any
+    ) -> AsyncIterator[TItem]:
+        """Iterate over all items requesting the next pages in advance.
+
+        While the items of one page are consumed, the following ``prefetch``
+        pages are already requested, so at most ``prefetch`` pages are held
+        in memory besides the current one. ``params`` are passed on to
+        ``get``.
+
+        .. code:: python
+
+            async for member in kc.groups.by_id(group_id).members.scan(prefetch=4):
+                await process(member)
+        """
+        return prefetch_pages(
+            lambda first, max: self.get(first=first, max=max, **params),
+            page_size,
+            prefetch,
+        )
+
+
+AttachedResources = list[tuple[str, Union[type[KeycloakResource], str]]]
 
 T = TypeVar("T", bound=KeycloakResourceWithIdentifier)
 
 
+class HandleCache:
+    """Keeps the most recently used handles returned by identifier getters.
+
+    One cache is shared by all getters of a ``KeycloakAdmin``, including the
+    getters of cached handles, so at most ``max_size`` handles are kept in
+    total. Handles are keyed by the getter, which is unique per parent
+    resource and attribute, and their identifier. Hence a handle is only
+    found again through the same parent, e.g. views created anew by
+    ``kc.for_realm(realm)`` don't share handles.
+    """
+
+    def __init__(self, max_size: int, metrics: HandleCacheMetrics):
+        self.max_size = max_size
+        self.metrics = metrics
+        self.handles: OrderedDict[
+            tuple[KeycloakResourceWithIdentifierGetter, str],
+            KeycloakResourceWithIdentifier,
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def get(
+        self, getter: KeycloakResourceWithIdentifierGetter[T], identifier: str
+    ) -> T:
+        """Get the cached handle or create it, evicting the least recently used."""
+        handles = self.handles
+        key = (getter, identifier)
+        handle = handles.get(key)
+        if handle is not None:
+            handles.move_to_end(key)
+            self.metrics.hits += 1
+            return cast(T, handle)
+        self.metrics.misses += 1
+        handle = handles[key] = getter.resource(
+            getter.get_connection, getter.get_url, identifier
+        )
+        handle._handle_cache = self
+        if len(handles) > self.max_size:
+            handles.popitem(last=False)
+            self.metrics.evictions += 1
+        return handle
+
+
 class KeycloakResourceWithIdentifierGetter(Generic[T]):
-    """Function which attaches to Keycloak resources to provide a child resource by identifier.
+    """Provides a child resource by identifier, e.g. ``kc.users.by_id``.
 
-    Using ``Callable`` does not properly work and although (as far as I
-    understand) it should be fixed: https://github.com/python/mypy/issues/708.
-    Honestly I really don't understand what's going on here, but writing it
-    this way resolved the mypy issue I was having
+    Each call creates a new handle, unless ``KeycloakAdmin`` was created with
+    a ``handle_cache_size``. Then handles with child resources, like
+    ``kc.users.by_id``, are taken from its ``HandleCache`` and the same
+    handle is returned again for the same identifier while it is cached.
+    Hits and misses are counted in ``KeycloakAdmin.handle_cache_metrics``.
+
+    Handles without child resources, like ``kc.users.by_id(user_id).groups.by_id``,
+    are always created anew, there is nothing attached to them to reuse.
+
+    The cache is no general speedup: a lookup costs more than creating a
+    handle, so ``kc.users.by_id(user_id).get()`` gets about a quarter slower.
+    It only pays off for chains through cached handles, like
+    ``kc.users.by_id(user_id).role_mappings.realm``, which get about twice
+    as fast, see ``benchmarks/resource_tree.py``.
     """
 
-    def __call__(self, identifier: str) -> T: ...
+    def __init__(self, resource: type[T], parent: Any):
+        self.resource = resource
+        self.get_connection = parent._get_client
+        self.get_url = parent.get_url
+        self.handle_cache: Optional[HandleCache] = (
+            parent._handle_cache
+            if getattr(resource, "_keycloak_resources", None)
+            else None
+        )
+
+    def __call__(self, identifier: str) -> T:
+        if self.handle_cache is None:
+            return self.resource(self.get_connection, self.get_url, identifier)
+        return self.handle_cache.get(self, identifier)
@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import RoleRepresentation
 
 from ... import AttachedResources, KeycloakResourceWithIdentifier
@@ -30,7 +31,7 @@ class RolesById(KeycloakResourceWithIdentifier):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return RoleRepresentation.from_dict(response.json())
+        return RoleRepresentation.from_dict(load_json(response))
 
     async def update(self, role_representation: RoleRepresentation):
         """Update a role by id.
@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import RoleRepresentation
 
 from .... import KeycloakResource
@@ -40,7 +41,7 @@ class RolesByNameComposites(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return RoleRepresentation.from_list(response.json())
+        return RoleRepresentation.from_list(load_json(response))
 
     async def delete(self, composite_roles: list[RoleRepresentation]):
         """Delete composites for a role by id.
@@ -1,17 +1,23 @@
-from typing import Optional
+from typing import Any, Iterator, Literal, Optional, Union, overload
 
 from keycloak_admin_aio._lib.utils import (
+    RawFormat,
     get_resource_id_in_location_header,
+    parse_list,
     remove_none,
 )
 from keycloak_admin_aio.types import RoleRepresentation
 
-from .. import AttachedResources, KeycloakResource, KeycloakResourceWithIdentifierGetter
+from .. import (
+    AttachedResources,
+    KeycloakResourceWithIdentifierGetter,
+    KeycloakResourceWithPagination,
+)
 from .by_id import RolesById
 from .by_name import RolesByName
 
 
-class Roles(KeycloakResource):
+class Roles(KeycloakResourceWithPagination[RoleRepresentation]):
     """Provides the Keycloak role resource.
 
     .. code:: python
@@ -46,18 +52,73 @@ class Roles(KeycloakResource):
         role_name = get_resource_id_in_location_header(response, is_no_uuid=True)
         return role_name
 
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: None = None,
+        lazy: Literal[False] = False,
+    ) -> list[RoleRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: None = None,
+        lazy: Literal[True],
+    ) -> Iterator[RoleRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
     async def get(
         self,
         brief_representation: Optional[bool] = None,
         first: Optional[int] = None,
         max: Optional[int] = None,
         search: Optional[str] = None,
-    ) -> list[RoleRepresentation]:
+        *,
+        raw: Optional[RawFormat] = None,
+        lazy: bool = False,
+    ) -> Union[
+        list[RoleRepresentation],
+        Iterator[RoleRepresentation],
+        list[dict[str, Any]],
+        bytes,
+    ]:
         """Get roles.
 
         .. code:: python
 
             roles: list[RoleRepresentation] = kc.roles.get()
+            roles_json: list[dict] = await kc.roles.get(raw="json")
         """
         connection = await self._get_connection()
         params = remove_none(
@@ -72,4 +133,4 @@ class Roles(KeycloakResource):
             self.get_url(),
             params=params,
         )
-        return RoleRepresentation.from_list(response.json())
+        return parse_list(response, RoleRepresentation, raw, lazy=lazy)
@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import UserRepresentation
 
 from ... import AttachedResources, KeycloakResourceWithIdentifier
@@ -38,7 +39,7 @@ class UsersById(KeycloakResourceWithIdentifier):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return UserRepresentation.from_dict(response.json())
+        return UserRepresentation.from_dict(load_json(response))
 
     async def update(self, user_representation: UserRepresentation):
         """Update user by id.
@@ -1,17 +1,18 @@
-from typing import Optional
+from typing import Any, Iterator, Literal, Optional, Union, overload
 
-from keycloak_admin_aio._lib.utils import remove_none
+from keycloak_admin_aio._json_codec import load_json
+from keycloak_admin_aio._lib.utils import RawFormat, parse_list, remove_none
 from keycloak_admin_aio.types import GroupRepresentation
 
 from .... import (
     AttachedResources,
-    KeycloakResource,
     KeycloakResourceWithIdentifierGetter,
+    KeycloakResourceWithPagination,
 )
 from .by_id import UsersByIdGroupsById
 
 
-class UsersByIdGroups(KeycloakResource):
+class UsersByIdGroups(KeycloakResourceWithPagination[GroupRepresentation]):
     """Provides the Keycloak groups resource for users by id
 
     .. code:: python
@@ -28,18 +29,73 @@ class UsersByIdGroups(KeycloakResource):
     def get_url(self) -> str:
         return f"{self._get_parent_url()}/groups"
 
+    @overload
     async def get(
         self,
         first: Optional[int] = None,
         max: Optional[int] = None,
         search: Optional[str] = None,
         brief_representation: bool = True,
-    ) -> list[GroupRepresentation]:
+        *,
+        raw: None = None,
+        lazy: Literal[False] = False,
+    ) -> list[GroupRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        brief_representation: bool = True,
+        *,
+        raw: None = None,
+        lazy: Literal[True],
+    ) -> Iterator[GroupRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        brief_representation: bool = True,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        brief_representation: bool = True,
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
+    async def get(
+        self,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        brief_representation: bool = True,
+        *,
+        raw: Optional[RawFormat] = None,
+        lazy: bool = False,
+    ) -> Union[
+        list[GroupRepresentation],
+        Iterator[GroupRepresentation],
+        list[dict[str, Any]],
+        bytes,
+    ]:
         """Get the user's groups.
 
         .. code:: python
 
             groups: list[GroupRepresentation] = await kc.users.by_id(user_id).groups.get()
+            groups_json: list[dict] = await kc.users.by_id(user_id).groups.get(raw="json")
         """
         connection = await self._get_connection()
         params = remove_none(
@@ -51,7 +107,7 @@ class UsersByIdGroups(KeycloakResource):
             }
         )
         response = await connection.get(self.get_url(), params=params)
-        return GroupRepresentation.from_list(response.json())
+        return parse_list(response, GroupRepresentation, raw, lazy=lazy)
 
     async def count(
         self,
@@ -66,4 +122,4 @@ class UsersByIdGroups(KeycloakResource):
         connection = await self._get_connection()
         params = remove_none({"search": search})
         response = await connection.get(f"{self.get_url()}/count", params=params)
-        return int(response.json()["count"])
+        return int(load_json(response)["count"])
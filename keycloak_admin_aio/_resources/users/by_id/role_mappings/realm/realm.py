@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import RoleRepresentation
 
 from ..... import KeycloakResource
@@ -26,7 +27,7 @@ class UsersByIdRoleMappingsRealm(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return RoleRepresentation.from_list(response.json())
+        return RoleRepresentation.from_list(load_json(response))
 
     async def create(self, role_representations: list[RoleRepresentation]):
         """Create realm role mappings for a user.
@@ -66,7 +67,7 @@ class UsersByIdRoleMappingsRealm(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(f"{self.get_url()}/available")
-        return RoleRepresentation.from_list(response.json())
+        return RoleRepresentation.from_list(load_json(response))
 
     async def composite(self) -> list[RoleRepresentation]:
         """Get composed realm roles for a user.
@@ -78,4 +79,4 @@ class UsersByIdRoleMappingsRealm(KeycloakResource):
 
         connection = await self._get_connection()
         response = await connection.get(f"{self.get_url()}/composite")
-        return RoleRepresentation.from_list(response.json())
+        return RoleRepresentation.from_list(load_json(response))
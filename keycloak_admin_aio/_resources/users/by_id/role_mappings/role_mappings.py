@@ -1,3 +1,4 @@
+from keycloak_admin_aio._json_codec import load_json
 from keycloak_admin_aio.types import MappingsRepresentation
 
 from .... import AttachedResources, KeycloakResource
@@ -30,4 +31,4 @@ class UsersByIdRoleMappings(KeycloakResource):
         """
         connection = await self._get_connection()
         response = await connection.get(self.get_url())
-        return MappingsRepresentation.from_dict(response.json())
+        return MappingsRepresentation.from_dict(load_json(response))
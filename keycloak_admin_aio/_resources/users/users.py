@@ -1,16 +1,72 @@
-from typing import Optional
+import inspect
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
+from keycloak_admin_aio._lib.json_stream import stream_list
+from keycloak_admin_aio._lib.pagination import fetch_pages_concurrently
 from keycloak_admin_aio._lib.utils import (
+    USER_BRIEF_REPRESENTATION_FIELDS,
+    RawFormat,
+    brief_representation_for,
     get_resource_id_in_location_header,
+    parse_list,
     remove_none,
 )
-from keycloak_admin_aio.types import UserRepresentation
+from keycloak_admin_aio.types import Columns, StringTable, UserRepresentation
 
-from .. import AttachedResources, KeycloakResource, KeycloakResourceWithIdentifierGetter
+from .. import (
+    AttachedResources,
+    KeycloakResourceWithIdentifierGetter,
+    KeycloakResourceWithPagination,
+)
 from .by_id import UsersById
 
 
-class Users(KeycloakResource):
+def _get_params(
+    brief_representation: Optional[bool],
+    first: Optional[int],
+    max: Optional[int],
+    search: Optional[str],
+    email: Optional[str],
+    email_verified: Optional[bool],
+    enabled: Optional[bool],
+    exact: Optional[bool],
+    first_name: Optional[str],
+    last_name: Optional[str],
+    idp_alias: Optional[str],
+    idp_user_id: Optional[str],
+    username: Optional[str],
+) -> dict[str, Any]:
+    """Query parameters shared by ``Users.get`` and ``Users.stream``."""
+    return remove_none(
+        {
+            "briefRepresentation": brief_representation,
+            "first": first,
+            "max": max,
+            "search": search,
+            "email": email,
+            "emailVerified": email_verified,
+            "enabled": enabled,
+            "exact": exact,
+            "firstName": first_name,
+            "lastName": last_name,
+            "idpAlias": idp_alias,
+            "idpUserId": idp_user_id,
+            "username": username,
+        }
+    )
+
+
+class Users(KeycloakResourceWithPagination[UserRepresentation]):
     """Provides the Keycloak user resource.
 
     .. code:: python
@@ -26,6 +82,30 @@ class Users(KeycloakResource):
     def get_url(self) -> str:
         return f"{self._get_parent_url()}/users"
 
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        email: Optional[str] = None,
+        email_verified: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        exact: Optional[bool] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        idp_alias: Optional[str] = None,
+        idp_user_id: Optional[str] = None,
+        username: Optional[str] = None,
+        *,
+        raw: None = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: Literal[False] = False,
+        fields: None = None,
+    ) -> list[UserRepresentation]: ...
+
+    @overload
     async def get(
         self,
         brief_representation: Optional[bool] = None,
@@ -41,33 +121,182 @@ class Users(KeycloakResource):
         idp_alias: Optional[str] = None,
         idp_user_id: Optional[str] = None,
         username: Optional[str] = None,
-    ) -> list[UserRepresentation]:
+        *,
+        raw: None = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: Literal[False] = False,
+        fields: Sequence[str],
+    ) -> list[Any]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        email: Optional[str] = None,
+        email_verified: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        exact: Optional[bool] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        idp_alias: Optional[str] = None,
+        idp_user_id: Optional[str] = None,
+        username: Optional[str] = None,
+        *,
+        raw: None = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: Literal[True],
+        fields: None = None,
+    ) -> Iterator[UserRepresentation]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        email: Optional[str] = None,
+        email_verified: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        exact: Optional[bool] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        idp_alias: Optional[str] = None,
+        idp_user_id: Optional[str] = None,
+        username: Optional[str] = None,
+        *,
+        raw: Literal["json"],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        email: Optional[str] = None,
+        email_verified: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        exact: Optional[bool] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        idp_alias: Optional[str] = None,
+        idp_user_id: Optional[str] = None,
+        username: Optional[str] = None,
+        *,
+        raw: Literal["bytes"],
+    ) -> bytes: ...
+
+    async def get(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        email: Optional[str] = None,
+        email_verified: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        exact: Optional[bool] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        idp_alias: Optional[str] = None,
+        idp_user_id: Optional[str] = None,
+        username: Optional[str] = None,
+        *,
+        raw: Optional[RawFormat] = None,
+        intern: Union[bool, StringTable] = False,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[
+        list[UserRepresentation],
+        Iterator[UserRepresentation],
+        list[dict[str, Any]],
+        list[Any],
+        bytes,
+    ]:
         """Get users.
 
         .. code:: python
 
             users: list[UserRepresentation] = await kc.users.get()
+            users_json: list[dict] = await kc.users.get(raw="json")
+            users_sharing_strings = await kc.users.get(intern=True)
+            user_records = await kc.users.get(fields=["id", "username"])
         """
         connection = await self._get_connection()
-        params = remove_none(
-            {
-                "briefRepresentation": brief_representation,
-                "first": first,
-                "max": max,
-                "search": search,
-                "email": email,
-                "emailVerified": email_verified,
-                "enabled": enabled,
-                "exact": exact,
-                "firstName": first_name,
-                "lastName": last_name,
-                "idpAlias": idp_alias,
-                "ipdUserId": idp_user_id,
-                "username": username,
-            }
+        brief_representation = brief_representation_for(
+            brief_representation, fields, USER_BRIEF_REPRESENTATION_FIELDS
+        )
+        params = _get_params(
+            brief_representation,
+            first,
+            max,
+            search,
+            email,
+            email_verified,
+            enabled,
+            exact,
+            first_name,
+            last_name,
+            idp_alias,
+            idp_user_id,
+            username,
         )
         response = await connection.get(self.get_url(), params=params)
-        return UserRepresentation.from_list(response.json())
+        return parse_list(
+            response, UserRepresentation, raw, intern, lazy=lazy, fields=fields
+        )
+
+    async def stream(
+        self,
+        brief_representation: Optional[bool] = None,
+        first: Optional[int] = None,
+        max: Optional[int] = None,
+        search: Optional[str] = None,
+        email: Optional[str] = None,
+        email_verified: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        exact: Optional[bool] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        idp_alias: Optional[str] = None,
+        idp_user_id: Optional[str] = None,
+        username: Optional[str] = None,
+    ) -> AsyncIterator[UserRepresentation]:
+        """Stream users as they arrive.
+
+        Unlike ``get`` the response is neither buffered nor decoded as a
+        whole, only the item being received is held in memory.
+
+        .. code:: python
+
+            async for user in kc.users.stream(max=10000):
+                ...
+        """
+        connection = await self._get_connection()
+        params = _get_params(
+            brief_representation,
+            first,
+            max,
+            search,
+            email,
+            email_verified,
+            enabled,
+            exact,
+            first_name,
+            last_name,
+            idp_alias,
+            idp_user_id,
+            username,
+        )
+        async for user in stream_list(
+            connection, self.get_url(), params, UserRepresentation.from_dict
+        ):
+            yield user
 
     async def create(self, user_representation: UserRepresentation) -> str:
         """Create user.
@@ -113,3 +342,61 @@ class Users(KeycloakResource):
         )
         response = await connection.get(f"{self.get_url()}/count", params=params)
         return int(response.text)
+
+    def scan_parallel(
+        self,
+        page_size: int = 100,
+        concurrency: int = 8,
+        ordered: bool = True,
+        **params: Any,
+    ) -> AsyncIterator[UserRepresentation]:
+        """Iterate over all users fetching their pages concurrently.
+
+        The user count determines the pages, of which at most ``concurrency``
+        are requested at a time. Users are yielded in page order if
+        ``ordered``, otherwise as soon as their page arrives. ``params`` are
+        passed on to ``get`` and, as far as it accepts them, to ``count``.
+
+        .. code:: python
+
+            async for user in kc.users.scan_parallel(concurrency=16, ordered=False):
+                print(user.username)
+        """
+        count_parameters = inspect.signature(self.count).parameters
+        count_params = {
+            name: value for name, value in params.items() if name in count_parameters
+        }
+        return fetch_pages_concurrently(
+            lambda: self.count(**count_params),
+            lambda first, max: self.get(first=first, max=max, **params),
+            page_size,
+            concurrency,
+            ordered,
+        )
+
+    async def scan_columns(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        page_size: int = 100,
+        prefetch: int = 2,
+        **params: Any,
+    ) -> Columns:
+        """Collect all users into ``Columns`` instead of dataclasses.
+
+        The pages are fetched like with ``scan`` and their JSON is appended to
+        the columns as it is. See ``Columns`` for the stored ``fields``.
+        ``params`` are passed on to ``get``.
+
+        .. code:: python
+
+            columns = await kc.users.scan_columns(
+                fields=["id", "username", "enabled", "emailVerified"]
+            )
+            unverified = columns["enabled"].is_true() & columns["emailVerified"].is_false()
+            for row in columns.rows(unverified):
+                print(row["username"])
+        """
+        columns = Columns(UserRepresentation, fields)
+        async for user in self.scan(page_size, prefetch, raw="json", **params):
+            columns.append(user)
+        return columns
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+import httpx
+
+IDEMPOTENT_EXTENSION = "keycloak_admin_aio.idempotent"
+"""Marks a ``POST`` or ``PATCH`` request as safe to retry."""
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+_never_sent_errors = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+"""Errors raised before the request reached Keycloak, so any request can be retried."""
+
+_connection_reset_errors = (
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+"""Errors of connections broken while the request was processed."""
+
+
+@dataclass
+class RetryPolicy:
+    """Retries requests failing with transient errors.
+
+    Responses with a status in ``retry_statuses`` and broken connections are
+    retried up to ``max_attempts`` attempts in total. Between attempts it
+    waits a random time between ``0`` and ``backoff_base * 2 ** (attempt - 1)``
+    seconds, capped at ``backoff_max`` ("full jitter"), unless the response
+    names a time with ``Retry-After``. That time is capped at ``backoff_max``
+    as well, so a server asking for a long pause can't stall a request.
+
+    ``POST`` and ``PATCH`` requests might not be idempotent, so they are only
+    retried with ``retry_non_idempotent`` or if the connection failed before
+    the request was sent.
+
+    .. code:: python
+
+        from keycloak_admin_aio import KeycloakAdmin, RetryPolicy
+
+        kc = KeycloakAdmin.with_password(
+            ...,  # provide credentials
+            retry_policy=RetryPolicy(max_attempts=5),
+        )
+    """
+
+    max_attempts: int = 3
+    """Attempts per request including the first one."""
+
+    backoff_base: float = 0.5
+    """Upper bound of the wait in seconds before the first retry."""
+
+    backoff_max: float = 30.0
+    """Upper bound of the wait in seconds before any retry."""
+
+    retry_statuses: Collection[int] = (429, 500, 502, 503, 504)
+    """Response statuses which are retried."""
+
+    respect_retry_after: bool = True
+    """Wait as long as the ``Retry-After`` header of a response asks for, up to ``backoff_max``."""
+
+    retry_non_idempotent: bool = False
+    """Retry ``POST`` and ``PATCH`` requests as well."""
+
+    def should_retry(self, request: httpx.Request, error: Exception) -> bool:
+        """Whether ``request`` failing with ``error`` is retried."""
+        if isinstance(error, _never_sent_errors):
+            return True
+        if not (
+            self.retry_non_idempotent
+            or request.method in IDEMPOTENT_METHODS
+            or request.extensions.get(IDEMPOTENT_EXTENSION)
+        ):
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, _connection_reset_errors)
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before retrying after the failed ``attempt``."""
+        if self.respect_retry_after and isinstance(error, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header given in seconds or as a date."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+
+@dataclass
+class Token:
+    """Tokens issued by the openid connect token endpoint."""
+
+    access_token: str
+    access_token_expire: datetime
+    refresh_token: Optional[str] = None
+    refresh_token_expire: Optional[datetime] = None
+
+    def is_access_token_valid(self) -> bool:
+        return datetime.now() <= self.access_token_expire
+
+    def is_refresh_token_valid(self) -> bool:
+        return (
+            self.refresh_token is not None
+            and self.refresh_token_expire is not None
+            and datetime.now() < self.refresh_token_expire
+        )
+
+
+class TokenStore(abc.ABC):
+    """Storage of the token which may be shared by several ``KeycloakAdmin``.
+
+    ``KeycloakAdmin`` keeps a copy of the token in memory and only consults
+    the store when that copy expired. It then adopts a valid token found in
+    the store or, while holding the store's ``lock``, fetches a new one and
+    saves it with ``set``.
+    """
+
+    @abc.abstractmethod
+    async def get(self) -> Optional[Token]:
+        """Get the stored token."""
+
+    @abc.abstractmethod
+    async def set(self, token: Token):
+        """Store a token."""
+
+    @abc.abstractmethod
+    def lock(self) -> contextlib.AbstractAsyncContextManager:
+        """Lock held while fetching a new token from Keycloak."""
+
+
+class InMemoryTokenStore(TokenStore):
+    """Keeps the token in memory. Used by default.
+
+    It can be shared by several ``KeycloakAdmin`` instances with the same
+    credentials in one process.
+    """
+
+    def __init__(self):
+        self.__token: Optional[Token] = None
+        self.__lock = asyncio.Lock()
+
+    async def get(self) -> Optional[Token]:
+        return self.__token
+
+    async def set(self, token: Token):
+        self.__token = token
+
+    def lock(self) -> contextlib.AbstractAsyncContextManager:
+        return self.__lock
+
+
+class FileTokenStore(TokenStore):
+    """Keeps the token in a file which is shared between processes.
+
+    Processes on the same host using the same ``path`` share one token and
+    only one of them fetches a new token at a time. Fetching is serialized
+    with an exclusive lock on ``<path>.lock``, so this store is only
+    available on POSIX systems.
+
+    .. code:: python
+
+        from keycloak_admin_aio import FileTokenStore, KeycloakAdmin
+
+        kc = KeycloakAdmin.with_password(
+            ...,  # provide credentials
+            token_store=FileTokenStore("/run/my-service/keycloak-token.json"),
+        )
+    """
+
+    lock_poll_interval: float = 0.05
+    """Seconds to wait before trying again to acquire the lock held by another process."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    async def get(self) -> Optional[Token]:
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        refresh_token_expire = data.get("refresh_token_expire")
+        return Token(
+            access_token=data["access_token"],
+            access_token_expire=datetime.fromtimestamp(data["access_token_expire"]),
+            refresh_token=data.get("refresh_token"),
+            refresh_token_expire=datetime.fromtimestamp(refresh_token_expire)
+            if refresh_token_expire is not None
+            else None,
+        )
+
+    async def set(self, token: Token):
+        data = {
+            "access_token": token.access_token,
+            "access_token_expire": token.access_token_expire.timestamp(),
+            "refresh_token": token.refresh_token,
+            "refresh_token_expire": token.refresh_token_expire.timestamp()
+            if token.refresh_token_expire is not None
+            else None,
+        }
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        file_descriptor = os.open(
+            temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with open(file_descriptor, "w") as file:
+            json.dump(data, file)
+        os.replace(temporary_path, self.path)
+
+    @contextlib.asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        import fcntl
+
+        file_descriptor = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            while True:
+                try:
+                    fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(self.lock_poll_interval)
+            try:
+                yield
+            finally:
+                fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+        finally:
+            os.close(file_descriptor)
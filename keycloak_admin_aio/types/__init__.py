@@ -80,6 +80,14 @@ __all__ = [
     "ClientRepresentation",
     "RequiredActionProviderRepresentation",
     "UserSession",
+    "Columns",
+    "Mask",
+    "StrColumn",
+    "IntColumn",
+    "BoolColumn",
+    "StringTable",
 ]
 
+from ._data_class import StringTable
+from .columns import BoolColumn, Columns, IntColumn, Mask, StrColumn
 from .types import *
@@ -1,29 +1,398 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import dataclasses
+from collections import namedtuple
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
-from dacite.core import from_dict
+from keycloak_admin_aio._lib.utils import remove_none
 
-from keycloak_admin_aio._lib.utils import asdict
+Deserializer = Callable[[dict], Any]
+Serializer = Callable[[Any], dict[str, Any]]
+
+_deserializers: dict[type, Deserializer] = {}
+_serializers: dict[type, Serializer] = {}
+_projections: dict[tuple[type, tuple[str, ...]], Deserializer] = {}
 
 
 class DataClass:
+    __slots__ = ()
+
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return get_serializer(type(self))(self)
 
     @staticmethod
     def to_dict_list(representation_list: list[T]) -> list[dict[str, Any]]:
-        return list(
-            map(lambda representation: representation.to_dict(), representation_list)
-        )
+        return [
+            get_serializer(type(representation))(representation)
+            for representation in representation_list
+        ]
 
     @classmethod
     def from_dict(cls, dictionary: dict):
-        return from_dict(data_class=cls, data=dictionary)
+        return get_deserializer(cls)(dictionary)
 
     @classmethod
-    def from_list(cls, _list: list[dict]):
-        return list(map(cls.from_dict, _list))
+    def from_list(cls, _list: list[dict], intern: Union[bool, StringTable] = False):
+        """Create a list of instances from a list of dicts.
+
+        With ``intern`` repeated strings, like attribute names or required
+        actions, are replaced by one shared instance. ``True`` interns them
+        within ``_list``, a ``StringTable`` across all lists it is passed to.
+        """
+        deserialize = get_deserializer(cls)
+        return [deserialize(dictionary) for dictionary in _interned(_list, intern)]
+
+    @classmethod
+    def iter_list(cls, _list: list[dict], intern: Union[bool, StringTable] = False):
+        """Like ``from_list`` but creates each instance only when it is iterated.
+
+        .. code:: python
+
+            from keycloak_admin_aio import UserRepresentation
+
+            users = UserRepresentation.iter_list(users_json)
+            admin = next(user for user in users if user.username == "admin")
+        """
+        return map(get_deserializer(cls), _interned(_list, intern))
+
+    @classmethod
+    def project_list(
+        cls,
+        _list: list[dict],
+        fields: Sequence[str],
+        intern: Union[bool, StringTable] = False,
+    ) -> list[Any]:
+        """Create a list of records holding only ``fields`` from a list of dicts.
+
+        The records are named tuples, so ``record.username`` works like on
+        instances of ``cls``, but they take a fraction of the memory.
+        Nested dataclasses in ``fields`` are converted as by ``from_list``.
+
+        .. code:: python
+
+            from keycloak_admin_aio import UserRepresentation
+
+            users = UserRepresentation.project_list(users_json, ["id", "username"])
+            print(users[0].username)
+        """
+        project = get_projection(cls, fields)
+        return [project(dictionary) for dictionary in _interned(_list, intern)]
+
+
+def _interned(_list: list[dict], intern: Union[bool, StringTable]) -> list[dict]:
+    if intern is True:
+        return StringTable().intern(_list)
+    if isinstance(intern, StringTable):
+        return intern.intern(_list)
+    return _list
+
+
+class StringTable:
+    """Maps equal strings to one shared instance.
+
+    A string is kept in the table once it occurred twice within one call of
+    ``intern``, so values unique to each item, like ids, don't accumulate.
+    Strings longer than ``max_length`` are left as they are. Pass the same
+    table to ``from_list`` for all pages of a scan to share strings across
+    them.
+
+    .. code:: python
+
+        from keycloak_admin_aio import StringTable
+
+        string_table = StringTable()
+        async for user in kc.users.scan(intern=string_table):
+            ...
+    """
+
+    def __init__(self, max_length: int = 64):
+        self.max_length = max_length
+        self.strings: dict[str, str] = {}
+
+    def intern(self, data: Any) -> Any:
+        """Copy decoded JSON replacing its strings with the shared instances."""
+        strings = self.strings
+        get_shared = strings.get
+        max_length = self.max_length
+        first_seen = {}
+        get_first_seen = first_seen.setdefault
+
+        def intern_string(value: str) -> str:
+            shared = get_shared(value)
+            if shared is not None:
+                return shared
+            if len(value) > max_length:
+                return value
+            shared = get_first_seen(value, value)
+            if shared is not value:
+                strings[value] = shared
+            return shared
+
+        def walk(value: Any) -> Any:
+            value_type = type(value)
+            if value_type is str:
+                return intern_string(value)
+            if value_type is dict:
+                return {intern_string(key): walk(item) for key, item in value.items()}
+            if value_type is list:
+                return [walk(item) for item in value]
+            return value
+
+        return walk(data)
 
 
 T = TypeVar("T", bound=DataClass)
+
+
+def make_slotted(cls: type[T], module: str) -> type[T]:
+    """Create a variant of the dataclass ``cls`` keeping its fields in ``__slots__``.
+
+    The variant is placed in ``module``, in whose namespace the string
+    annotations of ``cls`` are resolved. Hence nested dataclasses refer to
+    the variants defined in ``module`` as well.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in (*field_names, "__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = field_names
+    namespace["__module__"] = module
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def get_deserializer(cls: type) -> Deserializer:
+    """Get the deserializer of a dataclass, compiling it on first use."""
+    try:
+        return _deserializers[cls]
+    except KeyError:
+        deserializer = _deserializers[cls] = _compile_deserializer(cls)
+        return deserializer
+
+
+def _compile_deserializer(cls: type) -> Deserializer:
+    """Generates a function creating an instance of ``cls`` from a dict.
+
+    Keys missing in the dict get the field's default, unknown keys are
+    ignored. Values of fields with plain types (``str``, ``int``, ``Any``,
+    ``Literal``, lists and dicts thereof) are taken over as they are, only
+    nested dataclasses are converted. Unlike ``dacite`` the types of the
+    values are not checked.
+    """
+    namespace: dict[str, Any] = {"cls": cls, "MISSING": dataclasses.MISSING}
+    type_hints = get_type_hints(cls)
+    lines = ["def deserialize(data):", "    get = data.get"]
+    arguments = []
+    for index, field in enumerate(dataclasses.fields(cls)):
+        if not field.init:
+            continue
+        value = f"value_{index}"
+        if field.default is not dataclasses.MISSING:
+            namespace[f"default_{index}"] = field.default
+            lines.append(f"    {value} = get({field.name!r}, default_{index})")
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[f"default_factory_{index}"] = field.default_factory
+            lines.append(f"    {value} = get({field.name!r}, MISSING)")
+            lines.append(f"    if {value} is MISSING:")
+            lines.append(f"        {value} = default_factory_{index}()")
+        else:
+            lines.append(f"    {value} = data[{field.name!r}]")
+        conversion = _conversion(
+            _without_none(type_hints[field.name]), value, namespace
+        )
+        if conversion is not None:
+            lines.append(f"    if {value} is not None:")
+            lines.append(f"        {value} = {conversion}")
+        arguments.append(f"{field.name}={value}")
+    lines.append(f"    return cls({', '.join(arguments)})")
+    exec("\n".join(lines), namespace)
+    return namespace["deserialize"]
+
+
+def get_projection(cls: type, fields: Sequence[str]) -> Deserializer:
+    """Get the projection of a dataclass to ``fields``, compiling it on first use."""
+    key = (cls, tuple(fields))
+    try:
+        return _projections[key]
+    except KeyError:
+        projection = _projections[key] = _compile_projection(cls, key[1])
+        return projection
+
+
+def _compile_projection(cls: type, fields: tuple[str, ...]) -> Deserializer:
+    """Generates a function creating a named tuple of ``fields`` from a dict.
+
+    Missing keys are ``None``, values are converted like in the deserializer
+    of ``cls``. Raises ``ValueError`` for names which are no fields of ``cls``.
+    """
+    field_names = {field.name for field in dataclasses.fields(cls)}
+    unknown = [name for name in fields if name not in field_names]
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no fields {', '.join(unknown)}")
+    record = namedtuple(f"{cls.__name__}Record", fields, module=cls.__module__)
+    namespace: dict[str, Any] = {"record": record}
+    type_hints = get_type_hints(cls)
+    lines = ["def project(data):", "    get = data.get"]
+    values = []
+    for index, name in enumerate(fields):
+        value = f"value_{index}"
+        lines.append(f"    {value} = get({name!r})")
+        conversion = _conversion(_without_none(type_hints[name]), value, namespace)
+        if conversion is not None:
+            lines.append(f"    if {value} is not None:")
+            lines.append(f"        {value} = {conversion}")
+        values.append(value)
+    lines.append(f"    return record({', '.join(values)})")
+    exec("\n".join(lines), namespace)
+    return namespace["project"]
+
+
+def get_serializer(cls: type) -> Serializer:
+    """Get the serializer of a dataclass, compiling it on first use."""
+    try:
+        return _serializers[cls]
+    except KeyError:
+        serializer = _serializers[cls] = _compile_serializer(cls)
+        return serializer
+
+
+def _compile_serializer(cls: type) -> Serializer:
+    """Generates a function converting an instance of ``cls`` to a dict.
+
+    Fields which are ``None`` are left out in the same pass. Nested
+    dataclasses are converted and dicts are stripped of ``None`` values,
+    other values are referenced instead of being copied.
+    """
+    namespace: dict[str, Any] = {"remove_none": remove_none}
+    type_hints = get_type_hints(cls)
+    lines = ["def serialize(obj):", "    result = {}"]
+    for index, field in enumerate(dataclasses.fields(cls)):
+        value = f"value_{index}"
+        conversion = _serialization(
+            _without_none(type_hints[field.name]), value, namespace
+        )
+        lines.append(f"    {value} = obj.{field.name}")
+        lines.append(f"    if {value} is not None:")
+        lines.append(f"        result[{field.name!r}] = {conversion or value}")
+    lines.append("    return result")
+    exec("\n".join(lines), namespace)
+    return namespace["serialize"]
+
+
+def _without_none(type_hint: Any) -> Any:
+    """Strips ``None`` from ``Optional`` type hints."""
+    if get_origin(type_hint) is Union:
+        arguments = [arg for arg in get_args(type_hint) if arg is not type(None)]
+        if len(arguments) == 1:
+            return arguments[0]
+    return type_hint
+
+
+def _conversion(type_hint: Any, value: str, namespace: dict[str, Any]) -> Optional[str]:
+    """Python expression converting ``value`` to ``type_hint``.
+
+    ``None`` if the value can be taken over as it is.
+    """
+    origin = get_origin(type_hint)
+    if origin is Union:
+        non_optional_type_hint = _without_none(type_hint)
+        if non_optional_type_hint is type_hint:
+            return None
+        conversion = _conversion(non_optional_type_hint, value, namespace)
+        if conversion is None:
+            return None
+        return f"(None if {value} is None else {conversion})"
+    if origin is list:
+        (item_type,) = get_args(type_hint) or (Any,)
+        item = f"{value}_item"
+        conversion = _conversion(item_type, item, namespace)
+        if conversion is None:
+            return None
+        return f"[{conversion} for {item} in {value}]"
+    if origin is dict:
+        _, value_type = get_args(type_hint) or (Any, Any)
+        item = f"{value}_value"
+        conversion = _conversion(value_type, item, namespace)
+        if conversion is None:
+            return None
+        return (
+            f"{{{value}_key: {conversion} for {value}_key, {item} in {value}.items()}}"
+        )
+    if dataclasses.is_dataclass(type_hint):
+        name = f"deserialize_{type_hint.__name__}"
+        namespace[name] = _lazy_deserializer(type_hint, name, namespace)
+        return f"{name}({value})"
+    return None
+
+
+def _lazy_deserializer(cls: type, name: str, namespace: dict[str, Any]) -> Deserializer:
+    """Resolves the deserializer of a nested dataclass on first call.
+
+    Deferring the lookup allows recursive and mutually recursive dataclasses.
+    The resolved deserializer replaces this function in ``namespace``.
+    """
+
+    def deserialize(data: dict):
+        deserializer = namespace[name] = get_deserializer(cls)
+        return deserializer(data)
+
+    return deserialize
+
+
+def _serialization(
+    type_hint: Any, value: str, namespace: dict[str, Any]
+) -> Optional[str]:
+    """Python expression converting ``value`` of ``type_hint`` to plain data.
+
+    ``None`` if the value can be referenced as it is.
+    """
+    origin = get_origin(type_hint)
+    if origin is Union:
+        non_optional_type_hint = _without_none(type_hint)
+        if non_optional_type_hint is type_hint:
+            return None
+        conversion = _serialization(non_optional_type_hint, value, namespace)
+        if conversion is None:
+            return None
+        return f"(None if {value} is None else {conversion})"
+    if origin is list:
+        (item_type,) = get_args(type_hint) or (Any,)
+        item = f"{value}_item"
+        conversion = _serialization(item_type, item, namespace)
+        if conversion is None:
+            return None
+        return f"[{conversion} for {item} in {value}]"
+    if origin is dict:
+        _, value_type = get_args(type_hint) or (Any, Any)
+        item = f"{value}_value"
+        conversion = _serialization(value_type, item, namespace)
+        if conversion is None:
+            return f"remove_none({value})"
+        return (
+            f"{{{value}_key: {conversion} for {value}_key, {item} in {value}.items()"
+            f" if {item} is not None}}"
+        )
+    if dataclasses.is_dataclass(type_hint):
+        name = f"serialize_{type_hint.__name__}"
+        namespace[name] = _lazy_serializer(type_hint, name, namespace)
+        return f"{name}({value})"
+    return None
+
+
+def _lazy_serializer(cls: type, name: str, namespace: dict[str, Any]) -> Serializer:
+    """Resolves the serializer of a nested dataclass on first call."""
+
+    def serialize(obj: Any) -> dict[str, Any]:
+        serializer = namespace[name] = get_serializer(cls)
+        return serializer(obj)
+
+    return serialize
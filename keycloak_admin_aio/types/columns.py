@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Union,
+    get_origin,
+    get_type_hints,
+)
+
+from ._data_class import DataClass, _without_none
+
+
+class Mask:
+    """Selection of rows of ``Columns`` packed into the bits of an int.
+
+    Masks are combined with ``&``, ``|``, ``^`` and ``~``, which operate on
+    all rows at once.
+
+    .. code:: python
+
+        columns: Columns  # e.g. from kc.users.scan_columns()
+
+        mask = columns["enabled"].is_true() & columns["emailVerified"].is_false()
+        print(mask.count())
+        usernames = [columns["username"][index] for index in mask.indices()]
+    """
+
+    __slots__ = ("bits", "length")
+
+    def __init__(self, bits: int, length: int):
+        self.bits = bits
+        self.length = length
+
+    @classmethod
+    def from_bools(cls, values: Iterable[bool], length: int) -> Mask:
+        bitset = _Bitset()
+        for value in values:
+            bitset.append(value)
+        return cls(bitset.to_int(), length)
+
+    def __and__(self, other: Mask) -> Mask:
+        return Mask(self.bits & other.bits, self.length)
+
+    def __or__(self, other: Mask) -> Mask:
+        return Mask(self.bits | other.bits, self.length)
+
+    def __xor__(self, other: Mask) -> Mask:
+        return Mask(self.bits ^ other.bits, self.length)
+
+    def __invert__(self) -> Mask:
+        return Mask(~self.bits & ((1 << self.length) - 1), self.length)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Mask)
+            and self.bits == other.bits
+            and self.length == other.length
+        )
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self.bits >> index & 1)
+
+    def count(self) -> int:
+        """Number of selected rows."""
+        return bin(self.bits).count("1")
+
+    def indices(self) -> Iterator[int]:
+        """Indices of the selected rows in ascending order."""
+        data = self.bits.to_bytes((self.length + 7) // 8, "little")
+        for byte_index, byte in enumerate(data):
+            while byte:
+                lowest = byte & -byte
+                yield byte_index * 8 + lowest.bit_length() - 1
+                byte ^= lowest
+
+
+class _Bitset:
+    """Growable sequence of bits packed into a ``bytearray``."""
+
+    __slots__ = ("data", "length")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.length = 0
+
+    def append(self, value: bool):
+        if self.length % 8 == 0:
+            self.data.append(0)
+        if value:
+            self.data[-1] |= 1 << self.length % 8
+        self.length += 1
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.data[index >> 3] >> (index & 7) & 1)
+
+    def to_int(self) -> int:
+        return int.from_bytes(self.data, "little")
+
+
+class StrColumn:
+    """Column of strings. Each value is interned, so repeated values are stored once."""
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values: list[Optional[str]] = []
+
+    def append(self, value: Optional[str]):
+        self.values.append(value if value is None else sys.intern(value))
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def equals(self, value: str) -> Mask:
+        """Rows with ``value``."""
+        return Mask.from_bools((item == value for item in self.values), len(self))
+
+    def is_none(self) -> Mask:
+        """Rows without a value."""
+        return Mask.from_bools((item is None for item in self.values), len(self))
+
+
+class IntColumn:
+    """Column of integers packed into an ``array`` of 64 bit integers."""
+
+    __slots__ = ("values", "_present")
+
+    def __init__(self):
+        self.values = array("q")
+        self._present = _Bitset()
+
+    def append(self, value: Optional[int]):
+        self.values.append(0 if value is None else value)
+        self._present.append(value is not None)
+
+    def __getitem__(self, index: int) -> Optional[int]:
+        return self.values[index] if self._present[index] else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def where(self, predicate: Callable[[int], bool]) -> Mask:
+        """Rows with a value for which ``predicate`` is true."""
+        present = Mask(self._present.to_int(), len(self))
+        return present & Mask.from_bools(map(predicate, self.values), len(self))
+
+    def is_none(self) -> Mask:
+        """Rows without a value."""
+        return ~Mask(self._present.to_int(), len(self))
+
+
+class BoolColumn:
+    """Column of booleans packed into bits, one for the value and one for its presence."""
+
+    __slots__ = ("_values", "_present")
+
+    def __init__(self):
+        self._values = _Bitset()
+        self._present = _Bitset()
+
+    def append(self, value: Optional[bool]):
+        self._values.append(bool(value))
+        self._present.append(value is not None)
+
+    def __getitem__(self, index: int) -> Optional[bool]:
+        return self._values[index] if self._present[index] else None
+
+    def __len__(self) -> int:
+        return self._values.length
+
+    def is_true(self) -> Mask:
+        """Rows which are ``True``."""
+        return Mask(self._values.to_int(), len(self))
+
+    def is_false(self) -> Mask:
+        """Rows which are ``False``. Rows without a value are not included."""
+        return Mask(self._present.to_int() & ~self._values.to_int(), len(self))
+
+    def is_none(self) -> Mask:
+        """Rows without a value."""
+        return ~Mask(self._present.to_int(), len(self))
+
+
+Column = Union[StrColumn, IntColumn, BoolColumn]
+
+_column_types: dict[Any, type[Column]] = {
+    str: StrColumn,
+    int: IntColumn,
+    bool: BoolColumn,
+}
+
+
+def _column_type(type_hint: Any) -> Optional[type[Column]]:
+    type_hint = _without_none(type_hint)
+    if get_origin(type_hint) is Literal:
+        return StrColumn
+    return _column_types.get(type_hint)
+
+
+class Columns:
+    """Items of a list endpoint stored as one column per field.
+
+    The columns are derived from the string, integer and boolean fields of
+    ``representation``, other fields are not stored. ``fields`` restricts
+    them further. Rows are appended as the decoded JSON of the items.
+
+    .. code:: python
+
+        from keycloak_admin_aio import Columns, UserRepresentation
+
+        columns = Columns(UserRepresentation, fields=["id", "username", "enabled"])
+        columns.extend(await kc.users.get(raw="json"))
+    """
+
+    def __init__(
+        self,
+        representation: type[DataClass],
+        fields: Optional[Iterable[str]] = None,
+    ):
+        type_hints = get_type_hints(representation)
+        names = (
+            [field.name for field in dataclasses.fields(representation)]
+            if fields is None
+            else fields
+        )
+        self.columns: dict[str, Column] = {}
+        for name in names:
+            column_type = _column_type(type_hints.get(name))
+            if column_type is None:
+                if fields is None:
+                    continue
+                raise ValueError(f"'{name}' is no string, integer or boolean field")
+            self.columns[name] = column_type()
+        self._length = 0
+
+    def append(self, item: dict[str, Any]):
+        get = item.get
+        for name, column in self.columns.items():
+            column.append(get(name))
+        self._length += 1
+
+    def extend(self, items: Iterable[dict[str, Any]]):
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def rows(self, mask: Optional[Mask] = None) -> Iterator[dict[str, Any]]:
+        """Yield the rows, or the rows selected by ``mask``, as dicts."""
+        indices = range(len(self)) if mask is None else mask.indices()
+        for index in indices:
+            yield {name: column[index] for name, column in self.columns.items()}
@@ -0,0 +1,120 @@
+"""
+Variants of the dataclasses in ``keycloak_admin_aio.types`` keeping their
+fields in ``__slots__`` instead of a ``__dict__``.
+
+They have the same fields and methods, including ``from_dict``,
+``from_list`` and ``to_dict``, but need considerably less memory. Nested
+representations are slotted variants as well. Mind that they are distinct
+classes, so a slotted ``UserRepresentation`` is no instance of the regular
+``UserRepresentation``.
+
+.. code:: python
+
+    from keycloak_admin_aio.types import slotted
+
+    users: list[slotted.UserRepresentation] = slotted.UserRepresentation.from_list(
+        await kc.users.get(raw="json")
+    )
+"""
+
+# The string annotations of the variants are resolved in this module
+from typing import TYPE_CHECKING, Any, Literal, Optional  # noqa: F401
+
+from . import types
+from ._data_class import make_slotted
+
+# Needed for sphinx autodoc
+__all__ = [
+    "RoleRepresentation",
+    "RoleRepresentationComposites",
+    "ClientMappingsRepresentation",
+    "MappingsRepresentation",
+    "ProtocolMapperRepresentation",
+    "ClientScopeRepresentation",
+    "FederatedIdentityRepresentation",
+    "CredentialRepresentation",
+    "UserConsentRepresentation",
+    "UserRepresentation",
+    "GroupRepresentation",
+    "ScopeRepresentation",
+    "ResourceRepresentation",
+    "PolicyRepresentation",
+    "ResourceServerRepresentation",
+    "ClientRepresentation",
+    "RequiredActionProviderRepresentation",
+    "UserSession",
+]
+
+if TYPE_CHECKING:
+    # Declared as subclasses so that type checkers tell the variants from the
+    # regular classes while knowing their fields and methods. At runtime they
+    # are no subclasses, and fields of nested representations are annotated
+    # with the regular classes here.
+    class RoleRepresentationComposites(types.RoleRepresentationComposites): ...
+
+    class RoleRepresentation(types.RoleRepresentation): ...
+
+    class ClientMappingsRepresentation(types.ClientMappingsRepresentation): ...
+
+    class MappingsRepresentation(types.MappingsRepresentation): ...
+
+    class ProtocolMapperRepresentation(types.ProtocolMapperRepresentation): ...
+
+    class ClientScopeRepresentation(types.ClientScopeRepresentation): ...
+
+    class FederatedIdentityRepresentation(types.FederatedIdentityRepresentation): ...
+
+    class CredentialRepresentation(types.CredentialRepresentation): ...
+
+    class UserConsentRepresentation(types.UserConsentRepresentation): ...
+
+    class UserRepresentation(types.UserRepresentation): ...
+
+    class GroupRepresentation(types.GroupRepresentation): ...
+
+    class ScopeRepresentation(types.ScopeRepresentation): ...
+
+    class ResourceRepresentation(types.ResourceRepresentation): ...
+
+    class PolicyRepresentation(types.PolicyRepresentation): ...
+
+    class ResourceServerRepresentation(types.ResourceServerRepresentation): ...
+
+    class ClientRepresentation(types.ClientRepresentation): ...
+
+    class RequiredActionProviderRepresentation(
+        types.RequiredActionProviderRepresentation
+    ): ...
+
+    class UserSession(types.UserSession): ...
+else:
+    RoleRepresentationComposites = make_slotted(
+        types.RoleRepresentationComposites, __name__
+    )
+    RoleRepresentation = make_slotted(types.RoleRepresentation, __name__)
+    ClientMappingsRepresentation = make_slotted(
+        types.ClientMappingsRepresentation, __name__
+    )
+    MappingsRepresentation = make_slotted(types.MappingsRepresentation, __name__)
+    ProtocolMapperRepresentation = make_slotted(
+        types.ProtocolMapperRepresentation, __name__
+    )
+    ClientScopeRepresentation = make_slotted(types.ClientScopeRepresentation, __name__)
+    FederatedIdentityRepresentation = make_slotted(
+        types.FederatedIdentityRepresentation, __name__
+    )
+    CredentialRepresentation = make_slotted(types.CredentialRepresentation, __name__)
+    UserConsentRepresentation = make_slotted(types.UserConsentRepresentation, __name__)
+    UserRepresentation = make_slotted(types.UserRepresentation, __name__)
+    GroupRepresentation = make_slotted(types.GroupRepresentation, __name__)
+    ScopeRepresentation = make_slotted(types.ScopeRepresentation, __name__)
+    ResourceRepresentation = make_slotted(types.ResourceRepresentation, __name__)
+    PolicyRepresentation = make_slotted(types.PolicyRepresentation, __name__)
+    ResourceServerRepresentation = make_slotted(
+        types.ResourceServerRepresentation, __name__
+    )
+    ClientRepresentation = make_slotted(types.ClientRepresentation, __name__)
+    RequiredActionProviderRepresentation = make_slotted(
+        types.RequiredActionProviderRepresentation, __name__
+    )
+    UserSession = make_slotted(types.UserSession, __name__)
@@ -54,7 +54,7 @@ async def wait_for_server_to_start():
             await asyncio.sleep(1)
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 async def run_keycloak(request: pytest.FixtureRequest):
     """Run Keycloak in a container."""
     container_runtime = determine_container_runtime()
@@ -102,7 +102,7 @@ def event_loop():
 
 
 @pytest.fixture(scope="session")
-async def keycloak_admin():
+async def keycloak_admin(run_keycloak):
     """Instantiate the KeycloakAdmin client."""
     async with KeycloakAdmin.with_password(
         server_url=KEYCLOAK_URL, username=KEYCLOAK_ADMIN, password=KEYCLOAK_PASSWORD
@@ -0,0 +1,63 @@
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Union
+
+import httpx
+
+from keycloak_admin_aio import KeycloakAdmin
+
+Handler = Callable[[httpx.Request], Union[httpx.Response, Awaitable[httpx.Response]]]
+
+
+def respond_json(request: httpx.Request) -> httpx.Response:
+    """Answers every request with an empty JSON list."""
+    return httpx.Response(200, json=[])
+
+
+class MockKeycloak:
+    """Answers the requests of a ``KeycloakAdmin`` without a Keycloak server.
+
+    Token requests get a new token after ``token_delay`` seconds, or an
+    error if ``token_status_code`` is changed. All other requests are
+    answered by ``handler`` and recorded in ``requests``.
+    """
+
+    def __init__(self, handler: Handler = respond_json, token_delay: float = 0):
+        self.handler = handler
+        self.token_delay = token_delay
+        self.token_status_code = 200
+        self.token_requests = 0
+        self.requests: list[httpx.Request] = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/protocol/openid-connect/token"):
+            self.token_requests += 1
+            await asyncio.sleep(self.token_delay)
+            if self.token_status_code != 200:
+                return httpx.Response(
+                    self.token_status_code, json={"error": "invalid_grant"}
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": f"access-token-{self.token_requests}",
+                    "expires_in": 300,
+                    "refresh_token": f"refresh-token-{self.token_requests}",
+                    "refresh_expires_in": 1800,
+                },
+            )
+        self.requests.append(request)
+        response = self.handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    def keycloak_admin(self, **kwargs: Any) -> KeycloakAdmin:
+        """Create a ``KeycloakAdmin`` sending its requests to this mock."""
+        return KeycloakAdmin.with_password(
+            server_url="http://localhost:8080",
+            username="testing",
+            password="testing",
+            httpx_args={"transport": httpx.MockTransport(self.handle)},
+            **kwargs,
+        )
@@ -6,3 +6,9 @@ from keycloak_admin_aio import KeycloakAdmin
 @assert_not_raises
 async def test_get(keycloak_admin: KeycloakAdmin):
     await keycloak_admin.admin_events.get()
+
+
+@assert_not_raises
+async def test_stream(keycloak_admin: KeycloakAdmin):
+    events = [event async for event in keycloak_admin.admin_events.stream()]
+    assert events == await keycloak_admin.admin_events.get()
@@ -0,0 +1,50 @@
+import asyncio
+
+import httpx
+import pytest
+from mock_keycloak import MockKeycloak
+
+
+def reject_access_tokens(*access_tokens: str):
+    """Answers with ``401`` if the request bears one of ``access_tokens``."""
+    rejected = {f"Bearer {access_token}" for access_token in access_tokens}
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("Authorization") in rejected:
+            return httpx.Response(401)
+        return httpx.Response(200, json=[])
+
+    return handle
+
+
+async def test_renew_rejected_access_token():
+    """Test that a rejected token is renewed once and the request retried once"""
+    mock_keycloak = MockKeycloak(reject_access_tokens("access-token-1"))
+    async with mock_keycloak.keycloak_admin() as kc:
+        assert await kc.users.get() == []
+        assert await kc.get_access_token() == "access-token-2"
+    assert mock_keycloak.token_requests == 2
+    assert len(mock_keycloak.requests) == 2
+
+
+async def test_renew_rejected_access_token_concurrently():
+    """Test that concurrent requests rejecting the same token renew it once"""
+    mock_keycloak = MockKeycloak(reject_access_tokens("access-token-1"))
+    async with mock_keycloak.keycloak_admin() as kc:
+        await kc.get_access_token()
+        assert await asyncio.gather(*(kc.users.get() for _ in range(5))) == [[]] * 5
+    assert mock_keycloak.token_requests == 2
+    assert len(mock_keycloak.requests) == 10
+
+
+async def test_rejected_access_token_renewed():
+    """Test that a request rejected with the renewed token raises"""
+    mock_keycloak = MockKeycloak(
+        reject_access_tokens("access-token-1", "access-token-2")
+    )
+    async with mock_keycloak.keycloak_admin() as kc:
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await kc.users.get()
+    assert exc_info.value.response.status_code == 401
+    assert mock_keycloak.token_requests == 2
+    assert len(mock_keycloak.requests) == 2
@@ -0,0 +1,129 @@
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+import pytest
+
+from keycloak_admin_aio.types import (
+    ClientMappingsRepresentation,
+    DataClass,
+    GroupRepresentation,
+    MappingsRepresentation,
+    ResourceServerRepresentation,
+    RoleRepresentation,
+    UserRepresentation,
+)
+
+
+@dataclass
+class Node(DataClass):
+    name: str
+    kind: Literal["leaf", "branch"] = "leaf"
+    weight: Optional[int] = None
+    tags: list[str] = field(default_factory=list)
+    children: list["Node"] = field(default_factory=list)
+    by_name: Optional[dict[str, "Node"]] = None
+
+
+def test_from_dict_recursive():
+    """Test that recursive subGroups are converted at every level"""
+    data = {
+        "name": "a",
+        "subGroups": [
+            {"name": "b", "subGroups": [{"name": "c", "subGroups": []}]},
+            {"name": "d"},
+        ],
+    }
+    group = GroupRepresentation.from_dict(data)
+    assert group == GroupRepresentation(
+        name="a",
+        subGroups=[
+            GroupRepresentation(
+                name="b", subGroups=[GroupRepresentation(name="c", subGroups=[])]
+            ),
+            GroupRepresentation(name="d"),
+        ],
+    )
+    assert group.to_dict() == data
+
+
+def test_from_dict_nested_lists_and_dicts():
+    """Test that dataclasses within lists and dicts are converted"""
+    mappings = MappingsRepresentation.from_dict(
+        {
+            "clientMappings": {
+                "account": {
+                    "client": "account",
+                    "mappings": [{"name": "view-profile", "composite": False}],
+                }
+            },
+            "realmMappings": [{"name": "admin", "composites": {"realm": ["a"]}}],
+        }
+    )
+    client_mappings = mappings.clientMappings["account"]
+    assert isinstance(client_mappings, ClientMappingsRepresentation)
+    assert client_mappings.mappings == [
+        RoleRepresentation(name="view-profile", composite=False)
+    ]
+    assert mappings.realmMappings[0].composites.realm == ["a"]
+
+
+def test_from_dict_literal_and_optional():
+    """Test that Literal and Optional values are taken over as they are"""
+    resource_server = ResourceServerRepresentation.from_dict(
+        {"decisionStrategy": "AFFIRMATIVE", "resources": None}
+    )
+    assert resource_server.decisionStrategy == "AFFIRMATIVE"
+    assert resource_server.resources is None
+    assert Node.from_dict({"name": "a", "kind": "branch", "weight": None}) == Node(
+        "a", kind="branch"
+    )
+
+
+def test_from_dict_defaults():
+    """Test that missing keys get the field defaults and unknown keys are ignored"""
+    node = Node.from_dict({"name": "a", "unknown": 1})
+    assert node == Node("a")
+    assert node.tags is not Node.from_dict({"name": "a"}).tags
+    with pytest.raises(KeyError):
+        Node.from_dict({"kind": "leaf"})
+    assert UserRepresentation.from_dict({"username": "user", "unknown": [1]}) == (
+        UserRepresentation(username="user")
+    )
+
+
+def test_to_dict_round_trip():
+    """Test that to_dict returns the dict an instance was created from"""
+    data = {
+        "name": "root",
+        "kind": "branch",
+        "weight": 3,
+        "tags": ["x"],
+        "children": [{"name": "a", "kind": "leaf", "tags": [], "children": []}],
+        "by_name": {"b": {"name": "b", "kind": "leaf", "tags": [], "children": []}},
+    }
+    node = Node.from_dict(data)
+    assert isinstance(node.children[0], Node)
+    assert isinstance(node.by_name["b"], Node)
+    assert node.to_dict() == data
+    user = {
+        "id": "user-id",
+        "username": "user",
+        "enabled": True,
+        "attributes": {"locale": ["de"]},
+        "requiredActions": [],
+    }
+    assert UserRepresentation.from_dict(user).to_dict() == user
+
+
+def test_to_dict_removes_none_in_nested_items():
+    """Test that None is removed from nested dataclasses, also in list items"""
+    group = GroupRepresentation(
+        name="a",
+        subGroups=[GroupRepresentation(name="b")],
+        attributes={"x": ["y"], "z": None},
+    )
+    assert group.to_dict() == {
+        "name": "a",
+        "subGroups": [{"name": "b"}],
+        "attributes": {"x": ["y"]},
+    }
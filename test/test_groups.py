@@ -18,6 +18,13 @@ async def test_count(keycloak_admin: KeycloakAdmin):
     await keycloak_admin.groups.count()
 
 
+@assert_not_raises
+async def test_iter(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.groups.iter"""
+    groups = [item async for item in keycloak_admin.groups.iter(page_size=1)]
+    assert len(groups) == len(await keycloak_admin.groups.get())
+
+
 class TestByIdLifeCycle(ResourceLifeCycleTest):
     """Test keycloak_admin.groups & keycloak_admin.groups.by_id"""
 
@@ -78,6 +85,13 @@ class TestMembers(WithGroupIdFixture):
         """Test keycloak_admin.groups.by_id.members.get"""
         await keycloak_admin.groups.by_id(group_id).members.get()
 
+    @depends(on=WithGroupIdFixture.DEPENDENCIES)
+    @assert_not_raises
+    async def test_stream(self, keycloak_admin: KeycloakAdmin, group_id: str):
+        """Test keycloak_admin.groups.by_id.members.stream"""
+        members = keycloak_admin.groups.by_id(group_id).members
+        assert [member async for member in members.stream()] == await members.get()
+
 
 class TestChildren(WithGroupIdFixture):
     """Test keycloak_admin.groups.by_id.children"""
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def import_times() -> dict[str, int]:
+    """Import ``keycloak_admin_aio`` in a new interpreter with ``-X importtime``.
+
+    Returns the self time in microseconds by module.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import keycloak_admin_aio"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(self_time)
+    return times
+
+
+def test_resources_imported_lazily():
+    """Test that importing keycloak_admin_aio does not import the resources"""
+    modules = import_times()
+    assert "keycloak_admin_aio" in modules
+    resource_modules = [
+        module
+        for module in modules
+        if module.startswith("keycloak_admin_aio._resources.")
+        and module != "keycloak_admin_aio._resources.keycloak_resource"
+    ]
+    assert resource_modules == []
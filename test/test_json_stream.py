@@ -0,0 +1,82 @@
+import json
+from typing import Any
+
+import pytest
+
+from keycloak_admin_aio._lib.json_stream import JsonArrayParser
+
+
+def parse_chunks(*chunks: bytes) -> list[Any]:
+    parser = JsonArrayParser()
+    elements = []
+    for chunk in chunks:
+        elements.extend(parser.feed(chunk))
+    elements.extend(parser.close())
+    return elements
+
+
+def splits(body: bytes):
+    """The body as a single chunk, split at every offset and byte by byte."""
+    yield [body]
+    for offset in range(len(body) + 1):
+        yield [body[:offset], body[offset:]]
+    yield [body[index : index + 1] for index in range(len(body))]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[]",
+        " \n[ \t]\r\n",
+        "[12345, -6.5e10, 0, 1E+2,7]",
+        '["äöü€", "😀", {"name": "Jürgen"}]',
+        '["a\\"b", "[x]", "],[", "\\\\", {"k": "\\"]"}, "\\u00e4"]',
+        '[{"id": "a", "groups": [[], [1, [2]]]}, null, true, false]',
+    ],
+)
+def test_json_array_parser(text: str):
+    """Test that the parser yields the elements however the body is split"""
+    body = text.encode()
+    for chunks in splits(body):
+        assert parse_chunks(*chunks) == json.loads(text), chunks
+
+
+def test_json_array_parser_yields_complete_elements():
+    """Test that elements are returned as soon as their delimiter arrived"""
+    parser = JsonArrayParser()
+    assert parser.feed(b'[{"id": "a"}, 12') == [{"id": "a"}]
+    assert parser.feed(b"3") == []
+    assert parser.feed(b"4 ,") == [1234]
+    assert parser.feed(b"5]") == [5]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "  \n",
+        "[",
+        "[1, 2",
+        '["abc',
+        "[tru",
+        "[1,]",
+        "[1 2]",
+        "[1]x",
+        '{"id": "a"}',
+    ],
+)
+def test_json_array_parser_invalid(text: str):
+    """Test that malformed or truncated bodies raise however they are split"""
+    body = text.encode()
+    for chunks in splits(body):
+        with pytest.raises(ValueError):
+            parse_chunks(*chunks)
+
+
+def test_json_array_parser_truncated_utf8():
+    """Test that a body ending within a multibyte character raises on close"""
+    parser = JsonArrayParser()
+    assert parser.feed('["ä"]'.encode()[:3]) == []
+    with pytest.raises(ValueError):
+        parser.close()
@@ -1,11 +1,24 @@
 import asyncio
+from typing import AsyncIterator
 
+import httpx
 import pytest
 import test_roles
 from dependencies_plugin import depends
+from mock_keycloak import MockKeycloak
 from test_sessions import get_all_admin_cli_sessions
 
-from keycloak_admin_aio import KeycloakAdmin
+from keycloak_admin_aio import (
+    FileTokenStore,
+    KeycloakAdmin,
+    MsgspecJsonCodec,
+    OrjsonJsonCodec,
+    RateLimit,
+    StdlibJsonCodec,
+    _keycloak_admin_aio,
+)
+from keycloak_admin_aio._lib.utils import cast_non_optional
+from keycloak_admin_aio._resources.users.by_id import UsersById
 
 
 @depends(
@@ -32,3 +45,191 @@ async def test_only_one_session(keycloak_admin: KeycloakAdmin):
 
     if sessions_count_before + 1 != sessions_count_after:
         pytest.fail("KeycloakAdmin created instantiated to many sessions.")
+
+
+@pytest.mark.usefixtures("run_keycloak")
+async def test_token_lock_fast_path():
+    """Make sure that a valid token is returned without acquiring the lock"""
+    async with KeycloakAdmin.with_password(
+        server_url="http://localhost:8080", username="testing", password="testing"
+    ) as kc:
+        await kc.get_access_token()
+        await asyncio.gather(*[kc.roles.by_name("admin").get() for _ in range(10)])
+    assert kc.token_lock_metrics.lock_acquisitions == 1
+    assert kc.token_lock_metrics.fast_path_hits == 10
+
+
+@pytest.mark.usefixtures("run_keycloak")
+async def test_refresh_in_background():
+    """Make sure that requests don't wait for a token refreshed in the background"""
+    async with KeycloakAdmin.with_password(
+        server_url="http://localhost:8080",
+        username="testing",
+        password="testing",
+        refresh_in_background=True,
+    ) as kc:
+        await asyncio.sleep(1)
+        await kc.roles.by_name("admin").get()
+    assert kc.token_lock_metrics.lock_acquisitions == 1
+    assert kc.token_lock_metrics.fast_path_hits == 1
+
+
+async def test_refresh_in_background_failing(monkeypatch: pytest.MonkeyPatch):
+    """Test that failing background refreshes back off and report their error"""
+    monkeypatch.setattr(_keycloak_admin_aio, "_background_refresh_retry_base", 0.01)
+    mock_keycloak = MockKeycloak()
+    mock_keycloak.token_status_code = 401
+    async with mock_keycloak.keycloak_admin(refresh_in_background=True) as kc:
+        await asyncio.sleep(0.2)
+        assert 3 <= mock_keycloak.token_requests <= 6
+        assert isinstance(kc.background_refresh_error, httpx.HTTPStatusError)
+        mock_keycloak.token_status_code = 200
+        await asyncio.sleep(0.2)
+        assert kc.background_refresh_error is None
+        assert await kc.get_access_token() is not None
+
+
+@pytest.mark.usefixtures("run_keycloak")
+async def test_file_token_store(tmp_path):
+    """Make sure that instances sharing a FileTokenStore share one token"""
+    token_store = FileTokenStore(str(tmp_path / "token.json"))
+    kc_args = {
+        "server_url": "http://localhost:8080",
+        "username": "testing",
+        "password": "testing",
+        "token_store": token_store,
+    }
+    async with KeycloakAdmin.with_password(**kc_args) as kc:
+        access_token = await kc.get_access_token()
+    async with KeycloakAdmin.with_password(**kc_args) as kc:
+        assert await kc.get_access_token() == access_token
+        await kc.roles.by_name("admin").get()
+
+
+async def test_for_realm(keycloak_admin: KeycloakAdmin):
+    """Make sure that a realm view manages the realm it was created for"""
+    master = keycloak_admin.for_realm("master")
+    assert master.get_url() == keycloak_admin.get_url()
+    assert await master.users.count() == await keycloak_admin.users.count()
+
+
+async def test_fan_out(keycloak_admin: KeycloakAdmin):
+    """Make sure that fan_out reports results and errors per realm"""
+    realm_results = {
+        realm_result.realm: realm_result
+        async for realm_result in keycloak_admin.fan_out(
+            ["master", "non-existent-realm"], lambda realm: realm.users.count()
+        )
+    }
+    assert realm_results["master"].result == await keycloak_admin.users.count()
+    assert realm_results["non-existent-realm"].error is not None
+
+
+@pytest.mark.parametrize(
+    "json_codec_class", [StdlibJsonCodec, OrjsonJsonCodec, MsgspecJsonCodec]
+)
+async def test_json_codec(keycloak_admin: KeycloakAdmin, json_codec_class):
+    """Make sure that each json codec yields the same responses"""
+    try:
+        json_codec = json_codec_class()
+    except ImportError:
+        pytest.skip(f"{json_codec_class.name} is not installed")
+    async with KeycloakAdmin.with_password(
+        server_url="http://localhost:8080",
+        username="testing",
+        password="testing",
+        json_codec=json_codec,
+    ) as kc:
+        assert await kc.users.get() == await keycloak_admin.users.get()
+        assert await kc.groups.count() == await keycloak_admin.groups.count()
+
+
+async def test_handle_cache(keycloak_admin: KeycloakAdmin):
+    """Make sure that by_id returns cached handles with a handle_cache_size"""
+    users = await keycloak_admin.users.get()
+    async with KeycloakAdmin.with_password(
+        server_url="http://localhost:8080",
+        username="testing",
+        password="testing",
+        handle_cache_size=1,
+    ) as kc:
+        user = kc.users.by_id(users[0].id)
+        assert kc.users.by_id(users[0].id) is user
+        assert (await user.get()).id == users[0].id
+        kc.users.by_id("evicting-the-first-handle")
+        assert kc.users.by_id(users[0].id) is not user
+        assert kc.handle_cache_metrics.hits == 1
+        assert kc.handle_cache_metrics.misses == 3
+        assert kc.handle_cache_metrics.evictions == 2
+    assert keycloak_admin.users.by_id(users[0].id) is not keycloak_admin.users.by_id(
+        users[0].id
+    )
+
+
+async def test_handle_cache_size():
+    """Test that the handles cached by all getters stay within handle_cache_size"""
+    kc = KeycloakAdmin.with_password(
+        server_url="http://localhost:8080",
+        username="testing",
+        password="testing",
+        handle_cache_size=8,
+    )
+    for realm in ["master", "tenant"]:
+        realm_view = kc.for_realm(realm)
+        for index in range(10):
+            user = realm_view.users.by_id(f"user-{index}")
+            assert realm_view.users.by_id(f"user-{index}") is user
+            client = realm_view.clients.by_id(f"client-{index}")
+            assert realm_view.clients.by_id(f"client-{index}") is client
+            assert user.groups.by_id("group") is not user.groups.by_id("group")
+    metrics = kc.handle_cache_metrics
+    assert metrics.hits == 40
+    assert metrics.misses - metrics.evictions == 8
+    assert len(cast_non_optional(kc._handle_cache)) == 8
+    await kc.close()
+
+
+async def test_rate_limit(keycloak_admin: KeycloakAdmin):
+    """Make sure that requests beyond the rate limits are queued, not failed"""
+    users = await keycloak_admin.users.get()
+    async with KeycloakAdmin.with_password(
+        server_url="http://localhost:8080",
+        username="testing",
+        password="testing",
+        rate_limit=RateLimit(max_in_flight=2),
+        resource_rate_limits={UsersById: RateLimit(requests_per_second=20, burst=5)},
+    ) as kc:
+        fetched_users = await asyncio.gather(
+            *(kc.users.by_id(cast_non_optional(users[0].id)).get() for _ in range(20))
+        )
+        assert [user.id for user in fetched_users] == [users[0].id] * 20
+        rate_limit_metrics = cast_non_optional(kc.rate_limit_metrics)
+        assert rate_limit_metrics.admitted == 20
+        assert rate_limit_metrics.in_flight == 0
+        assert kc.resource_rate_limit_metrics[UsersById].max_waiting > 0
+
+
+async def test_rate_limit_stream():
+    """Test that a streamed response keeps its max_in_flight slot until closed"""
+
+    async def stream_users() -> AsyncIterator[bytes]:
+        yield b'[{"id": "a"},'
+        yield b'{"id": "b"}]'
+
+    mock_keycloak = MockKeycloak(
+        lambda request: httpx.Response(200, content=stream_users())
+    )
+    async with mock_keycloak.keycloak_admin(
+        rate_limit=RateLimit(max_in_flight=1)
+    ) as kc:
+        rate_limit_metrics = cast_non_optional(kc.rate_limit_metrics)
+        users = kc.users.stream()
+        assert (await users.__anext__()).id == "a"
+        get_users = asyncio.create_task(kc.users.get())
+        await asyncio.sleep(0.01)
+        assert len(mock_keycloak.requests) == 1
+        assert rate_limit_metrics.waiting == 1
+        assert [user.id async for user in users] == ["b"]
+        assert [user.id for user in await get_users] == ["a", "b"]
+        assert len(mock_keycloak.requests) == 2
+        assert rate_limit_metrics.in_flight == 0
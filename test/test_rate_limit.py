@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+import pytest
+from mock_keycloak import MockKeycloak
+
+from keycloak_admin_aio import KeycloakAdmin, RateLimit
+from keycloak_admin_aio._rate_limit import RateLimiter
+from keycloak_admin_aio._resources import get_resource_class
+from keycloak_admin_aio._resources.attack_detection.brute_force.users import (
+    Users as BruteForceUsers,
+)
+from keycloak_admin_aio._resources.users.by_id import UsersById
+
+
+async def test_rate_limit_waits_for_token_before_slot():
+    """Test that requests waiting for a token don't occupy a max_in_flight slot"""
+    rate_limiter = RateLimiter(
+        RateLimit(requests_per_second=20, burst=1, max_in_flight=1)
+    )
+    async with rate_limiter.admit():
+        pass
+
+    async def admit():
+        async with rate_limiter.admit():
+            pass
+
+    waiting = asyncio.create_task(admit())
+    await asyncio.sleep(0.01)
+    assert rate_limiter.metrics.waiting == 1
+    assert rate_limiter._semaphore is not None
+    assert not rate_limiter._semaphore.locked()
+    await waiting
+    assert rate_limiter.metrics.admitted == 2
+
+
+def test_get_resource_class():
+    """Test that resource paths resolve to the classes of the resources"""
+    assert get_resource_class(KeycloakAdmin, "users.by_id") is UsersById
+    assert (
+        get_resource_class(KeycloakAdmin, "attack_detection.brute_force.users")
+        is BruteForceUsers
+    )
+    with pytest.raises(ValueError):
+        get_resource_class(KeycloakAdmin, "users.by_name")
+    with pytest.raises(ValueError):
+        get_resource_class(KeycloakAdmin, "users.get")
+
+
+async def test_resource_rate_limits_by_path():
+    """Test that resource_rate_limits accepts resource paths"""
+    mock_keycloak = MockKeycloak(
+        lambda request: httpx.Response(
+            200, json=[] if request.url.path.endswith("/users") else {}
+        )
+    )
+    async with mock_keycloak.keycloak_admin(
+        resource_rate_limits={"users.by_id": RateLimit(max_in_flight=1)}
+    ) as kc:
+        await kc.users.get()
+        await kc.users.by_id("user-id").get()
+    assert kc.resource_rate_limit_metrics["users.by_id"].admitted == 1
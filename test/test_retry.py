@@ -0,0 +1,154 @@
+from typing import Optional
+
+import httpx
+import pytest
+from mock_keycloak import MockKeycloak
+
+from keycloak_admin_aio import KeycloakAdmin, RetryPolicy, UserRepresentation
+from keycloak_admin_aio._retry import IDEMPOTENT_EXTENSION, parse_retry_after
+
+
+def status_error(method: str, status_code: int, **kwargs) -> httpx.HTTPStatusError:
+    request = httpx.Request(method, "http://localhost:8080", **kwargs)
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "method,status_code,retried",
+    [
+        ("GET", 503, True),
+        ("DELETE", 429, True),
+        ("GET", 404, False),
+        ("POST", 503, False),
+    ],
+)
+def test_should_retry_status(method: str, status_code: int, retried: bool):
+    """Test which responses RetryPolicy retries"""
+    error = status_error(method, status_code)
+    assert RetryPolicy().should_retry(error.request, error) is retried
+
+
+def test_should_retry_non_idempotent():
+    """Test that POST requests are only retried when allowed"""
+    error = status_error("POST", 503)
+    assert RetryPolicy(retry_non_idempotent=True).should_retry(error.request, error)
+    error = status_error("POST", 503, extensions={IDEMPOTENT_EXTENSION: True})
+    assert RetryPolicy().should_retry(error.request, error)
+    request = httpx.Request("POST", "http://localhost:8080")
+    assert RetryPolicy().should_retry(request, httpx.ConnectError("", request=request))
+    assert not RetryPolicy().should_retry(request, httpx.ReadError("", request=request))
+
+
+def test_delay():
+    """Test the full jitter backoff and Retry-After capped at backoff_max"""
+    retry_policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    error = status_error("GET", 503)
+    assert all(0 <= retry_policy.delay(attempt, error) <= 5 for attempt in range(10))
+    error.response.headers["Retry-After"] = "3"
+    assert retry_policy.delay(1, error) == 3
+    error.response.headers["Retry-After"] = "7"
+    assert retry_policy.delay(1, error) == 5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+async def test_retry_policy(keycloak_admin: KeycloakAdmin):
+    """Make sure that requests succeed unchanged with a retry policy"""
+    async with KeycloakAdmin.with_password(
+        server_url="http://localhost:8080",
+        username="testing",
+        password="testing",
+        retry_policy=RetryPolicy(),
+    ) as kc:
+        assert await kc.users.get() == await keycloak_admin.users.get()
+        with pytest.raises(httpx.HTTPStatusError):
+            await kc.users.by_id("non-existent-user").get()
+        assert kc.retry_metrics.retries == 0
+
+
+def respond_with(*status_codes: int, headers: Optional[dict[str, str]] = None):
+    """Answers with ``status_codes`` in turn, then with an empty JSON list."""
+    status_code_iter = iter(status_codes)
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        status_code = next(status_code_iter, 200)
+        if status_code == 200:
+            return httpx.Response(200, json=[])
+        return httpx.Response(status_code, headers=headers)
+
+    return handle
+
+
+async def test_retry_transient_status():
+    """Test that a 503 response is retried and the retry is counted"""
+    mock_keycloak = MockKeycloak(respond_with(503))
+    async with mock_keycloak.keycloak_admin(
+        retry_policy=RetryPolicy(backoff_base=0.01)
+    ) as kc:
+        assert await kc.users.get() == []
+    assert len(mock_keycloak.requests) == 2
+    assert kc.retry_metrics.retries == 1
+    assert kc.retry_metrics.retries_by_reason == {"503": 1}
+    assert kc.retry_metrics.exhausted == 0
+    assert 0 <= kc.retry_metrics.total_backoff <= 0.01
+
+
+@pytest.mark.parametrize("retry_after,backoff", [("0.02", 0.02), ("60", 0.05)])
+async def test_retry_after(retry_after: str, backoff: float):
+    """Test that Retry-After is waited for, up to backoff_max"""
+    mock_keycloak = MockKeycloak(
+        respond_with(429, headers={"Retry-After": retry_after})
+    )
+    async with mock_keycloak.keycloak_admin(
+        retry_policy=RetryPolicy(backoff_max=0.05)
+    ) as kc:
+        assert await kc.users.get() == []
+    assert len(mock_keycloak.requests) == 2
+    assert kc.retry_metrics.retries_by_reason == {"429": 1}
+    assert kc.retry_metrics.total_backoff == backoff
+
+
+async def test_retry_exhausted():
+    """Test that the last error is raised after max_attempts attempts"""
+    mock_keycloak = MockKeycloak(respond_with(503, 503, 502, 503))
+    async with mock_keycloak.keycloak_admin(
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.01)
+    ) as kc:
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await kc.users.get()
+    assert exc_info.value.response.status_code == 502
+    assert len(mock_keycloak.requests) == 3
+    assert kc.retry_metrics.retries == 2
+    assert kc.retry_metrics.retries_by_reason == {"503": 2}
+    assert kc.retry_metrics.exhausted == 1
+
+
+async def test_retry_exhausted_transport_error():
+    """Test that the last transport error is raised after max_attempts attempts"""
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    mock_keycloak = MockKeycloak(refuse)
+    async with mock_keycloak.keycloak_admin(
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.01)
+    ) as kc:
+        with pytest.raises(httpx.ConnectError):
+            await kc.users.get()
+    assert len(mock_keycloak.requests) == 2
+    assert kc.retry_metrics.retries_by_reason == {"ConnectError": 1}
+    assert kc.retry_metrics.exhausted == 1
+
+
+async def test_retry_non_idempotent():
+    """Test that a POST request failing with 503 is not retried"""
+    mock_keycloak = MockKeycloak(respond_with(503))
+    async with mock_keycloak.keycloak_admin(
+        retry_policy=RetryPolicy(backoff_base=0.01)
+    ) as kc:
+        with pytest.raises(httpx.HTTPStatusError):
+            await kc.users.create(UserRepresentation(username="user"))
+    assert len(mock_keycloak.requests) == 1
+    assert kc.retry_metrics.retries == 0
+    assert kc.retry_metrics.exhausted == 0
@@ -0,0 +1,47 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from mock_keycloak import MockKeycloak
+
+from keycloak_admin_aio import FileTokenStore, Token
+
+
+def make_token() -> Token:
+    now = datetime.now().replace(microsecond=0)
+    return Token(
+        access_token="access-token",
+        access_token_expire=now + timedelta(minutes=5),
+        refresh_token="refresh-token",
+        refresh_token_expire=now + timedelta(minutes=30),
+    )
+
+
+async def test_file_token_store_round_trip(tmp_path):
+    """Test that FileTokenStore returns the token it stored"""
+    token_store = FileTokenStore(str(tmp_path / "token.json"))
+    token = make_token()
+    await token_store.set(token)
+    assert await token_store.get() == token
+    assert await FileTokenStore(str(tmp_path / "token.json")).get() == token
+
+
+async def test_file_token_store_without_token(tmp_path):
+    """Test that FileTokenStore returns None for a missing or corrupt file"""
+    path = tmp_path / "token.json"
+    assert await FileTokenStore(str(path)).get() is None
+    path.write_text('{"access_token": ')
+    assert await FileTokenStore(str(path)).get() is None
+
+
+async def test_file_token_store_lock(tmp_path):
+    """Test that instances sharing a token file fetch only one token"""
+    path = str(tmp_path / "token.json")
+    mock_keycloak = MockKeycloak(token_delay=0.1)
+    kc_1 = mock_keycloak.keycloak_admin(token_store=FileTokenStore(path))
+    kc_2 = mock_keycloak.keycloak_admin(token_store=FileTokenStore(path))
+    async with kc_1, kc_2:
+        access_tokens = await asyncio.gather(
+            kc_1.get_access_token(), kc_2.get_access_token()
+        )
+    assert mock_keycloak.token_requests == 1
+    assert access_tokens[0] == access_tokens[1]
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import test_groups
 import test_roles
@@ -10,6 +12,7 @@ from keycloak_admin_aio import (
     RoleRepresentation,
     UserRepresentation,
 )
+from keycloak_admin_aio.types import StringTable, slotted
 
 
 @assert_not_raises
@@ -18,12 +21,116 @@ async def test_get(keycloak_admin: KeycloakAdmin):
     await keycloak_admin.users.get()
 
 
+@assert_not_raises
+async def test_get_raw(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.get with raw"""
+    users = await keycloak_admin.users.get()
+    users_json = await keycloak_admin.users.get(raw="json")
+    assert [user["id"] for user in users_json] == [user.id for user in users]
+    assert json.loads(await keycloak_admin.users.get(raw="bytes")) == users_json
+
+
+@assert_not_raises
+async def test_get_slotted(keycloak_admin: KeycloakAdmin):
+    """Test parsing keycloak_admin.users.get into slotted types"""
+    users = await keycloak_admin.users.get()
+    slotted_users = slotted.UserRepresentation.from_list(
+        await keycloak_admin.users.get(raw="json")
+    )
+    assert UserRepresentation.to_dict_list(users) == [
+        user.to_dict() for user in slotted_users
+    ]
+
+
+@assert_not_raises
+async def test_get_intern(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.get with intern"""
+    users = await keycloak_admin.users.get()
+    assert await keycloak_admin.users.get(intern=True) == users
+    string_table = StringTable()
+    users_interned = [
+        user async for user in keycloak_admin.users.scan(intern=string_table)
+    ]
+    assert users_interned == users
+
+
+@assert_not_raises
+async def test_get_lazy(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.get with lazy"""
+    users = await keycloak_admin.users.get()
+    assert list(await keycloak_admin.users.get(lazy=True)) == users
+
+
+@assert_not_raises
+async def test_get_fields(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.get with fields"""
+    users = await keycloak_admin.users.get(brief_representation=True)
+    records = await keycloak_admin.users.get(fields=["id", "username"])
+    assert [(record.id, record.username) for record in records] == [
+        (user.id, user.username) for user in users
+    ]
+
+
+@assert_not_raises
+async def test_stream(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.stream"""
+    users = [user async for user in keycloak_admin.users.stream()]
+    assert users == await keycloak_admin.users.get()
+
+
 @assert_not_raises
 async def test_count(keycloak_admin: KeycloakAdmin):
     """Test keycloak_admin.users.count"""
     await keycloak_admin.users.count()
 
 
+@assert_not_raises
+async def test_iter(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.iter"""
+    users = [item async for item in keycloak_admin.users.iter(page_size=1)]
+    assert len(users) == len(await keycloak_admin.users.get())
+
+
+@assert_not_raises
+async def test_scan(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.scan"""
+    users = [user async for user in keycloak_admin.users.scan(page_size=1, prefetch=3)]
+    assert [user.id for user in users] == [
+        user.id for user in await keycloak_admin.users.get()
+    ]
+
+
+@assert_not_raises
+async def test_scan_parallel(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.scan_parallel"""
+    users = [
+        user
+        async for user in keycloak_admin.users.scan_parallel(
+            page_size=1, concurrency=4, ordered=False
+        )
+    ]
+    assert sorted(user.id for user in users) == sorted(
+        user.id for user in await keycloak_admin.users.get()
+    )
+
+
+@assert_not_raises
+async def test_scan_columns(keycloak_admin: KeycloakAdmin):
+    """Test keycloak_admin.users.scan_columns"""
+    columns = await keycloak_admin.users.scan_columns(
+        fields=["id", "enabled", "emailVerified"], page_size=1
+    )
+    users = await keycloak_admin.users.get()
+    assert list(columns.rows()) == [
+        {"id": user.id, "enabled": user.enabled, "emailVerified": user.emailVerified}
+        for user in users
+    ]
+    mask = columns["enabled"].is_true() & columns["emailVerified"].is_false()
+    assert [columns["id"][index] for index in mask.indices()] == [
+        user.id for user in users if user.enabled and user.emailVerified is False
+    ]
+
+
 class TestByIdLifeCycle(ResourceLifeCycleTest):
     """Test keycloak_admin.users & keycloak_admin.users.by_id"""
 